@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from collections.abc import Callable
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, TypeGuard
@@ -19,7 +20,13 @@ def supports_loop_factories(pytest_asyncio: ModuleType | None) -> TypeGuard[Modu
     """Return True when pytest-asyncio is installed at a version that supports loop factories."""
     if pytest_asyncio is None:
         return False
-    return parse(pytest_asyncio.__version__) >= _MIN_PYTEST_ASYNCIO_VERSION
+    return _version_supports_loop_factories(pytest_asyncio.__version__)
+
+
+@functools.cache
+def _version_supports_loop_factories(version: str) -> bool:
+    """Compare a pytest-asyncio version string against the minimum, parsing each version only once."""
+    return parse(version) >= _MIN_PYTEST_ASYNCIO_VERSION
 
 
 def mark_postgresql_async_fixture(func: Callable[..., Any]) -> Callable[..., Any]:
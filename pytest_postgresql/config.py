@@ -2,13 +2,18 @@
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, TypeVar
 
 from _pytest._py.path import LocalPath
-from pytest import FixtureRequest
+from pytest import FixtureRequest, StashKey
 
+T = TypeVar("T")
 
-@dataclass(frozen=True)
+# also tells the pg_ctl lookup whether postgresql_exec was set explicitly
+_default_exec = "/usr/lib/postgresql/14/bin/pg_ctl"
+
+
+@dataclass(frozen=True, slots=True)
 class PostgreSQLConfig:
     """PostgreSQL Config."""
 
@@ -25,10 +30,26 @@ class PostgreSQLConfig:
     load: list[Path | str]
     postgres_options: str
     drop_test_database: bool
+    tmpfs: bool
+
+
+_config_key = StashKey[PostgreSQLConfig]()
 
 
 def get_config(request: FixtureRequest) -> PostgreSQLConfig:
-    """Return a PostgreSQLConfig instance with configuration options."""
+    """Return a PostgreSQLConfig instance with configuration options.
+
+    Options are read once per pytest session and cached on the pytest config object.
+    """
+    cfg = request.config.stash.get(_config_key, None)
+    if cfg is None:
+        cfg = _build_config(request)
+        request.config.stash[_config_key] = cfg
+    return cfg
+
+
+def _build_config(request: FixtureRequest) -> PostgreSQLConfig:
+    """Read configuration options from command line and ini file."""
 
     def get_postgresql_option(option: str) -> Any:
         name = "postgresql_" + option
@@ -51,18 +72,15 @@ def get_config(request: FixtureRequest) -> PostgreSQLConfig:
         load=load_paths,
         postgres_options=get_postgresql_option("postgres_options"),
         drop_test_database=request.config.getoption("postgresql_drop_test_database"),
+        tmpfs=get_postgresql_option("tmpfs"),
     )
     return cfg
 
 
-def detect_paths(load_paths: list[LocalPath | str]) -> list[Path | str]:
-    """Convert path to sql files to Path instances."""
-    converted_load_paths: list[Path | str] = []
-    for path in load_paths:
-        if isinstance(path, LocalPath):
-            path = str(path)
-        if path.endswith(".sql"):
-            converted_load_paths.append(Path(path))
-        else:
-            converted_load_paths.append(path)
-    return converted_load_paths
+def detect_paths(load_paths: Iterable[LocalPath | Path | str | T]) -> list[Path | str | T]:
+    """Convert path to sql files to Path instances.
+
+    Elements that are neither strings nor LocalPaths, like callables, are kept as they are.
+    """
+    paths = [str(path) if isinstance(path, LocalPath) else path for path in load_paths]
+    return [Path(path) if isinstance(path, str) and path.endswith(".sql") else path for path in paths]
@@ -17,8 +17,15 @@
 # along with pytest-postgresql.  If not, see <http://www.gnu.org/licenses/>.
 """Fixture factories for postgresql fixtures."""
 
-from pytest_postgresql.factories.client import postgresql, postgresql_async
+from pytest_postgresql.factories.client import postgresql, postgresql_async, postgresql_rollback
 from pytest_postgresql.factories.noprocess import postgresql_noproc
 from pytest_postgresql.factories.process import PortType, postgresql_proc
 
-__all__ = ("PortType", "postgresql", "postgresql_async", "postgresql_noproc", "postgresql_proc")
+__all__ = (
+    "PortType",
+    "postgresql",
+    "postgresql_async",
+    "postgresql_noproc",
+    "postgresql_proc",
+    "postgresql_rollback",
+)
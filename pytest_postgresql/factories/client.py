@@ -17,7 +17,7 @@
 # along with pytest-postgresql.  If not, see <http://www.gnu.org/licenses/>.
 """Fixture factory for postgresql client."""
 
-from typing import AsyncIterator, Callable, Iterator, cast
+from typing import AsyncIterator, Callable, Iterator, Literal, cast
 
 import psycopg
 import pytest
@@ -37,6 +37,8 @@ except ImportError:
 
 pytest_asyncio = _pytest_asyncio
 
+ScopeName = Literal["session", "package", "module", "class", "function"]
+
 
 def _postgresql_async_unavailable_stub() -> Callable[[FixtureRequest], AsyncIterator[AsyncConnection]]:
     """Return a sync fixture stub that raises when pytest-asyncio is missing or too old."""
@@ -60,6 +62,7 @@ def postgresql(
     process_fixture_name: str,
     dbname: str | None = None,
     isolation_level: "psycopg.IsolationLevel | None" = None,
+    scope: ScopeName = "function",
 ) -> Callable[[FixtureRequest], Iterator[Connection]]:
     """Return connection fixture factory for PostgreSQL.
 
@@ -67,10 +70,11 @@ def postgresql(
     :param dbname: database name
     :param isolation_level: optional postgresql isolation level
                             defaults to server's default
+    :param scope: fixture scope; the database lives as long as the fixture
     :returns: function which makes a connection to postgresql
     """
 
-    @pytest.fixture
+    @pytest.fixture(scope=scope)
     def postgresql_factory(request: FixtureRequest) -> Iterator[Connection]:
         """Fixture connection factory for PostgreSQL.
 
@@ -80,20 +84,15 @@ def postgresql(
         proc_fixture: PostgreSQLExecutor | NoopExecutor = request.getfixturevalue(process_fixture_name)
         config = get_config(request)
 
-        pg_host = proc_fixture.host
-        pg_port = proc_fixture.port
-        pg_user = proc_fixture.user
-        pg_password = proc_fixture.password
-        pg_options = proc_fixture.options
         pg_db = dbname or proc_fixture.dbname
         janitor = DatabaseJanitor(
-            user=pg_user,
-            host=pg_host,
-            port=pg_port,
+            user=proc_fixture.user,
+            host=proc_fixture.host,
+            port=proc_fixture.port,
             dbname=pg_db,
             template_dbname=proc_fixture.template_dbname,
             version=proc_fixture.version,
-            password=pg_password,
+            password=proc_fixture.password,
             isolation_level=isolation_level,
         )
         if config.drop_test_database:
@@ -101,11 +100,11 @@ def postgresql(
         with janitor:
             db_connection: Connection = psycopg.connect(
                 dbname=pg_db,
-                user=pg_user,
-                password=pg_password,
-                host=pg_host,
-                port=pg_port,
-                options=pg_options,
+                user=proc_fixture.user,
+                password=proc_fixture.password,
+                host=proc_fixture.host,
+                port=proc_fixture.port,
+                options=proc_fixture.options,
             )
             try:
                 if isolation_level is not None:
@@ -117,6 +116,31 @@ def postgresql(
     return postgresql_factory
 
 
+def postgresql_rollback(connection_fixture_name: str) -> Callable[[FixtureRequest], Iterator[Connection]]:
+    """Return transactional connection fixture factory for PostgreSQL.
+
+    Each test runs inside a transaction on the connection from a broader scoped
+    client fixture, which is rolled back afterwards instead of dropping the database.
+    Tests must not call ``commit()``, but may use nested ``transaction()`` blocks.
+
+    :param connection_fixture_name: name of the (e.g. session scoped) client fixture
+    :returns: function which yields a connection inside a transaction
+    """
+
+    @pytest.fixture
+    def postgresql_rollback_factory(request: FixtureRequest) -> Iterator[Connection]:
+        """Fixture transactional connection factory for PostgreSQL.
+
+        :param request: fixture request object
+        :returns: postgresql client inside a transaction
+        """
+        db_connection: Connection = request.getfixturevalue(connection_fixture_name)
+        with db_connection.transaction(force_rollback=True):
+            yield db_connection
+
+    return postgresql_rollback_factory
+
+
 def postgresql_async(
     process_fixture_name: str,
     dbname: str | None = None,
@@ -145,20 +169,15 @@ def postgresql_async(
         proc_fixture: PostgreSQLExecutor | NoopExecutor = request.getfixturevalue(process_fixture_name)
         config = get_config(request)
 
-        pg_host = proc_fixture.host
-        pg_port = proc_fixture.port
-        pg_user = proc_fixture.user
-        pg_password = proc_fixture.password
-        pg_options = proc_fixture.options
         pg_db = dbname or proc_fixture.dbname
         janitor = AsyncDatabaseJanitor(
-            user=pg_user,
-            host=pg_host,
-            port=pg_port,
+            user=proc_fixture.user,
+            host=proc_fixture.host,
+            port=proc_fixture.port,
             dbname=pg_db,
             template_dbname=proc_fixture.template_dbname,
             version=proc_fixture.version,
-            password=pg_password,
+            password=proc_fixture.password,
             isolation_level=isolation_level,
         )
         if config.drop_test_database:
@@ -166,11 +185,11 @@ def postgresql_async(
         async with janitor:
             db_connection: AsyncConnection = await AsyncConnection.connect(
                 dbname=pg_db,
-                user=pg_user,
-                password=pg_password,
-                host=pg_host,
-                port=pg_port,
-                options=pg_options,
+                user=proc_fixture.user,
+                password=proc_fixture.password,
+                host=proc_fixture.host,
+                port=proc_fixture.port,
+                options=proc_fixture.options,
             )
             try:
                 if isolation_level is not None:
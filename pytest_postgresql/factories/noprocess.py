@@ -24,16 +24,18 @@ from typing import Callable, Iterator
 import pytest
 from pytest import FixtureRequest
 
-from pytest_postgresql.config import get_config
+from pytest_postgresql.config import detect_paths, get_config
 from pytest_postgresql.executor_noop import NoopExecutor
 from pytest_postgresql.janitor import DatabaseJanitor
 
+# xdist sets the worker id before plugins get imported and it never changes for a process.
+_XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+
 
 def xdistify_dbname(dbname: str) -> str:
     """Modify the database name depending on the presence and usage of xdist."""
-    xdist_worker = os.getenv("PYTEST_XDIST_WORKER")
-    if xdist_worker:
-        return f"{dbname}{xdist_worker}"
+    if _XDIST_WORKER:
+        return f"{dbname}{_XDIST_WORKER}"
     return dbname
 
 
@@ -46,6 +48,7 @@ def postgresql_noproc(
     options: str = "",
     load: list[Callable | str | Path] | None = None,
     depends_on: str | None = None,
+    parallel_load: bool = False,
 ) -> Callable[[FixtureRequest], Iterator[NoopExecutor]]:
     """Postgresql noprocess factory.
 
@@ -57,8 +60,11 @@ def postgresql_noproc(
     :param options: Postgresql connection options
     :param load: List of functions used to initialize database's template.
     :param depends_on: Optional name of the fixture to depend on.
+    :param parallel_load: Load elements of the load list concurrently.
+        Use only if they do not depend on each other.
     :returns: function which makes a postgresql process
     """
+    factory_load = detect_paths(load) if load else None
 
     @pytest.fixture(scope="session")
     def postgresql_noproc_fixture(request: FixtureRequest) -> Iterator[NoopExecutor]:
@@ -86,7 +92,7 @@ def postgresql_noproc(
             base_template_dbname = None
 
         pg_dbname = xdistify_dbname(dbname or config.dbname)
-        pg_load = load or config.load
+        pg_load = factory_load or config.load
         drop_test_database = config.drop_test_database
 
         # In this case there's a risk that both seeded and depends_on fixture
@@ -117,8 +123,7 @@ def postgresql_noproc(
         if drop_test_database:
             janitor.drop()
         with janitor:
-            for load_element in pg_load:
-                janitor.load(load_element)
+            janitor.load_many(pg_load, parallel=parallel_load)
             yield noop_exec
 
     return postgresql_noproc_fixture
@@ -17,10 +17,12 @@
 # along with pytest-postgresql.  If not, see <http://www.gnu.org/licenses/>.
 """Fixture factory for postgresql process."""
 
+import functools
 import logging
 import os
 import os.path
 import platform
+import shutil
 import subprocess
 import tempfile
 from pathlib import Path
@@ -31,7 +33,7 @@ import pytest
 from port_for import PortForException, get_port
 from pytest import FixtureRequest, TempPathFactory
 
-from pytest_postgresql.config import PostgreSQLConfig, get_config
+from pytest_postgresql.config import PostgreSQLConfig, _default_exec, detect_paths, get_config
 from pytest_postgresql.exceptions import ExecutableMissingException
 from pytest_postgresql.executor import PostgreSQLExecutor
 from pytest_postgresql.janitor import DatabaseJanitor
@@ -40,19 +42,36 @@ logger = logging.getLogger(__name__)
 
 PortType = port_for.PortType  # mypy requires explicit export
 
+_SHM_DIR = "/dev/shm"
+
 
 def _pg_exe(executable: str | None, config: PostgreSQLConfig) -> str:
     """If executable is set, use it. Otherwise best effort to find the executable."""
-    postgresql_ctl = executable or config.exec
+    if executable:
+        return executable
+    return _find_pg_ctl(config.exec)
+
+
+@functools.cache
+def _find_pg_ctl(postgresql_ctl: str) -> str:
+    """Find pg_ctl executable, looking it up only once per process."""
+    pg_bindir = os.environ.get("PG_BINDIR")
+    # an explicitly configured executable wins, PG_BINDIR overrides the built-in default path
+    if pg_bindir and postgresql_ctl == _default_exec:
+        return os.path.join(pg_bindir, "pg_ctl")
     # check if that executable exists, as it's no on systems' PATH
-    # only replace it if executable isn't passed manually
-    if not os.path.exists(postgresql_ctl) and executable is None:
-        try:
-            pg_bindir = subprocess.check_output(["pg_config", "--bindir"], universal_newlines=True).strip()
-        except FileNotFoundError as ex:
-            raise ExecutableMissingException("Could not find pg_config executable. Is it in system $PATH?") from ex
-        postgresql_ctl = os.path.join(pg_bindir, "pg_ctl")
-    return postgresql_ctl
+    if os.path.exists(postgresql_ctl):
+        return postgresql_ctl
+    if pg_bindir:
+        return os.path.join(pg_bindir, "pg_ctl")
+    pg_ctl_on_path = shutil.which("pg_ctl")
+    if pg_ctl_on_path:
+        return pg_ctl_on_path
+    try:
+        pg_bindir = subprocess.check_output(["pg_config", "--bindir"], universal_newlines=True).strip()
+    except FileNotFoundError as ex:
+        raise ExecutableMissingException("Could not find pg_config executable. Is it in system $PATH?") from ex
+    return os.path.join(pg_bindir, "pg_ctl")
 
 
 def _pg_port(port: PortType | None, config: PostgreSQLConfig, excluded_ports: Iterable[int]) -> int:
@@ -62,20 +81,38 @@ def _pg_port(port: PortType | None, config: PostgreSQLConfig, excluded_ports: It
     return pg_port
 
 
-def _prepare_dir(tmpdir: Path, pg_port: PortType, session_token: str) -> tuple[Path, Path]:
-    """Prepare a directory for the executor."""
-    if platform.system() == "Windows":
+def _claimed_ports(port_path: Path) -> set[int]:
+    """Return ports already claimed by other process fixtures through their port files."""
+    claimed_ports = set()
+    for port_file in port_path.glob("postgresql-*.port"):
+        claimed_port = port_file.stem.removeprefix("postgresql-")
+        if claimed_port.isdigit():
+            claimed_ports.add(int(claimed_port))
+    return claimed_ports
+
+
+def _prepare_dir(tmpdir: Path, pg_port: PortType, session_token: str, tmpfs: bool = False) -> tuple[Path, Path]:
+    """Prepare a directory for the executor.
+
+    With tmpfs requested, the data directory is placed in /dev/shm on Linux,
+    so that PostgreSQL does not write to disk at all.
+    """
+    system = platform.system()
+    if system == "Windows":
         # initdb on Windows cannot mkdir through existing pytest temp parents.
         temp_dir = Path(tempfile.gettempdir())
         datadir = temp_dir / f"pytest-postgresql-data-{session_token}-{pg_port}"
         # Keep the logfile on the same drive as pgdata; pytest basetemp can be
         # on a different volume and pg_ctl rejects the -l path with Access denied.
         logfile_path = temp_dir / f"pytest-postgresql-{session_token}-{pg_port}.log"
+    elif tmpfs and system == "Linux" and os.path.isdir(_SHM_DIR):
+        datadir = Path(_SHM_DIR) / f"pytest-postgresql-data-{session_token}-{pg_port}"
+        logfile_path = tmpdir / f"postgresql.{pg_port}.log"
     else:
         datadir = tmpdir / f"data-{pg_port}"
         logfile_path = tmpdir / f"postgresql.{pg_port}.log"
 
-    if platform.system() == "FreeBSD":
+    if system == "FreeBSD":
         datadir.mkdir()
         with (datadir / "pg_hba.conf").open(mode="a") as conf_file:
             conf_file.write("host all all 0.0.0.0/0 trust\n")
@@ -94,6 +131,7 @@ def postgresql_proc(
     unixsocketdir: str | None = None,
     postgres_options: str | None = None,
     load: list[Callable | str | Path] | None = None,
+    parallel_load: bool = False,
 ) -> Callable[[FixtureRequest, TempPathFactory], PostgreSQLExecutor]:
     """Postgresql process factory.
 
@@ -114,8 +152,11 @@ def postgresql_proc(
     :param unixsocketdir: directory to create postgresql's unixsockets
     :param postgres_options: Postgres executable options for use by pg_ctl
     :param load: List of functions used to initialize database's template.
+    :param parallel_load: Load elements of the load list concurrently.
+        Use only if they do not depend on each other.
     :returns: function which makes a postgresql process
     """
+    factory_load = detect_paths(load) if load else None
 
     @pytest.fixture(scope="session")
     def postgresql_proc_fixture(request: FixtureRequest, tmp_path_factory: TempPathFactory) -> PostgreSQLExecutor:
@@ -126,8 +167,15 @@ def postgresql_proc(
         :returns: tcp executor
         """
         config = get_config(request)
+        pg_host = host or config.host
+        pg_user = user or config.user
+        pg_password = password or config.password
         pg_dbname = dbname or config.dbname
-        pg_load = load or config.load
+        pg_options = options or config.options
+        pg_unixsocketdir = unixsocketdir or config.unixsocketdir
+        pg_startparams = startparams or config.startparams
+        pg_postgres_options = postgres_options or config.postgres_options
+        pg_load = factory_load or config.load
         postgresql_ctl = _pg_exe(executable, config)
         port_path = tmp_path_factory.getbasetemp()
         if hasattr(request.config, "workerinput"):
@@ -135,6 +183,8 @@ def postgresql_proc(
 
         n = 0
         used_ports: set[int] = set()
+        # Skip ports other instances already hold, so collisions are left to actual races.
+        claimed_ports = _claimed_ports(port_path)
         port_filename_path: Path | None = None
         postgresql_executor: PostgreSQLExecutor | None = None
         session_token = str(os.getpid())
@@ -171,7 +221,7 @@ def postgresql_proc(
         try:
             while True:
                 try:
-                    pg_port = _pg_port(port, config, used_ports)
+                    pg_port = _pg_port(port, config, used_ports | claimed_ports)
                     candidate_port_file = port_path / f"postgresql-{pg_port}.port"
                     if pg_port in used_ports:
                         raise PortForException(
@@ -179,8 +229,14 @@ def postgresql_proc(
                             f"{candidate_port_file} is already used."
                         )
                     used_ports.add(pg_port)
-                    with candidate_port_file.open("x") as port_file:
-                        port_file.write(f"pg_port {pg_port}\n")
+                    # Exclusive creation is an atomic claim on every platform, including Windows
+                    # where fcntl-style locks are unavailable. Each claim is its own file,
+                    # so releasing a port is a plain unlink during cleanup.
+                    port_fd = os.open(candidate_port_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+                    try:
+                        os.write(port_fd, f"pg_port {pg_port}\n".encode())
+                    finally:
+                        os.close(port_fd)
                     port_filename_path = candidate_port_file
                     break
                 except FileExistsError:
@@ -194,21 +250,21 @@ def postgresql_proc(
 
             tmpdir = tmp_path_factory.mktemp(f"pytest-postgresql-{request.fixturename}")
             assert tmpdir.is_dir()
-            datadir, logfile_path = _prepare_dir(tmpdir, str(pg_port), session_token)
+            datadir, logfile_path = _prepare_dir(tmpdir, str(pg_port), session_token, tmpfs=config.tmpfs)
 
             postgresql_executor = PostgreSQLExecutor(
                 executable=postgresql_ctl,
-                host=host or config.host,
+                host=pg_host,
                 port=pg_port,
-                user=user or config.user,
-                password=password or config.password,
+                user=pg_user,
+                password=pg_password,
                 dbname=pg_dbname,
-                options=options or config.options,
+                options=pg_options,
                 datadir=str(datadir.resolve()),
-                unixsocketdir=unixsocketdir or config.unixsocketdir,
+                unixsocketdir=pg_unixsocketdir,
                 logfile=str(logfile_path.resolve()),
-                startparams=startparams or config.startparams,
-                postgres_options=postgres_options or config.postgres_options,
+                startparams=pg_startparams,
+                postgres_options=pg_postgres_options,
             )
             postgresql_executor.start()
             postgresql_executor.wait_for_postgres()
@@ -224,8 +280,7 @@ def postgresql_proc(
             if config.drop_test_database:
                 janitor.drop()
             janitor.init()
-            for load_element in pg_load:
-                janitor.load(load_element)
+            janitor.load_many(pg_load, parallel=parallel_load)
 
             def cleanup() -> None:
                 try:
@@ -2,26 +2,32 @@
 
 import asyncio
 import inspect
+import itertools
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
+from functools import cache
 from pathlib import Path
 from types import TracebackType
-from typing import AsyncIterator, Callable, Iterator, Type, TypeVar
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Type, TypeVar
 
 import psycopg
 import psycopg.sql as sql
-from packaging.version import parse
+from packaging.version import Version, parse
 from psycopg import AsyncCursor, Connection, Cursor
 
-from pytest_postgresql.loader import build_loader, sql_async
+from pytest_postgresql.loader import build_loader, sql_async, sql_many
 from pytest_postgresql.retry import retry, retry_async
 
-Version = type(parse("1"))
-
-
 DatabaseJanitorType = TypeVar("DatabaseJanitorType", bound="DatabaseJanitor")
 AsyncDatabaseJanitorType = TypeVar("AsyncDatabaseJanitorType", bound="AsyncDatabaseJanitor")
 
 
+@cache
+def _parse_version(version: str) -> Version:
+    """Parse a version string, once per distinct string."""
+    return parse(version)
+
+
 class BaseDatabaseJanitor:
     """Common base class for database janitors."""
 
@@ -34,7 +40,7 @@ class BaseDatabaseJanitor:
     as_template: bool
     _connection_timeout: int
     isolation_level: "psycopg.IsolationLevel | None"
-    version: Version  # type: ignore[valid-type]
+    version: Version
 
     def __init__(
         self,
@@ -42,7 +48,7 @@ class BaseDatabaseJanitor:
         user: str,
         host: str,
         port: str | int,
-        version: str | float | Version,  # type: ignore[valid-type]
+        version: str | float | Version,
         dbname: str,
         template_dbname: str | None = None,
         as_template: bool = False,
@@ -75,7 +81,7 @@ class BaseDatabaseJanitor:
         self._connection_timeout = connection_timeout
         self.isolation_level = isolation_level
         if not isinstance(version, Version):
-            self.version = parse(str(version))
+            self.version = _parse_version(str(version))
         else:
             self.version = version
 
@@ -96,15 +102,20 @@ class BaseDatabaseJanitor:
 class DatabaseJanitor(BaseDatabaseJanitor):
     """Manage database state for specific tasks."""
 
+    _admin_conn: Connection | None = None
+    _reuse_admin_conn: bool = False
+
     def init(self) -> None:
         """Create database in postgresql."""
-        with self.cursor() as cur:
-            if self.template_dbname:
-                # And make sure no-one is left connected to the template database.
-                # Otherwise, Creating database from template will fail
-                self._terminate_connection(cur, self.template_dbname)
-            query = self._build_create_database_sql()
-            cur.execute(query)
+        self._with_admin_cursor(self._create_database)
+
+    def _create_database(self, cur: Cursor) -> None:
+        if self.template_dbname:
+            # And make sure no-one is left connected to the template database.
+            # Otherwise, Creating database from template will fail
+            self._terminate_connection(cur, self.template_dbname)
+        query = self._build_create_database_sql()
+        cur.execute(query)
 
     @staticmethod
     def _database_exists(cur: Cursor, dbname: str) -> bool:
@@ -113,16 +124,18 @@ class DatabaseJanitor(BaseDatabaseJanitor):
 
     def drop(self) -> None:
         """Drop database in postgresql."""
+        self._with_admin_cursor(self._drop_database)
+
+    def _drop_database(self, cur: Cursor) -> None:
         # We cannot drop the database while there are connections to it, so we
         # terminate all connections first while not allowing new connections.
-        with self.cursor() as cur:
-            if not self._database_exists(cur, self.dbname):
-                return
-            self._dont_datallowconn(cur, self.dbname)
-            self._terminate_connection(cur, self.dbname)
-            if self.is_template():
-                cur.execute(sql.SQL("ALTER DATABASE {} WITH is_template false").format(sql.Identifier(self.dbname)))
-            cur.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(self.dbname)))
+        if not self._database_exists(cur, self.dbname):
+            return
+        self._dont_datallowconn(cur, self.dbname)
+        self._terminate_connection(cur, self.dbname)
+        if self.is_template():
+            cur.execute(sql.SQL("ALTER DATABASE {} WITH is_template false").format(sql.Identifier(self.dbname)))
+        cur.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(self.dbname)))
 
     @staticmethod
     def _dont_datallowconn(cur: Cursor, dbname: str) -> None:
@@ -156,9 +169,38 @@ class DatabaseJanitor(BaseDatabaseJanitor):
             password=self.password,
         )
 
-    @contextmanager
-    def cursor(self, dbname: str = "postgres") -> Iterator[Cursor]:
-        """Return postgresql cursor."""
+    def load_many(self, loads: Iterable[Callable | str | Path], parallel: bool = False) -> None:
+        """Load data into a database from several sources, in order.
+
+        Consecutive sql files are executed over a single connection,
+        other elements are handled the same way as in :meth:`load`.
+
+        :param loads: elements accepted by :meth:`load`
+        :param parallel: load all elements concurrently, each over its own connection.
+            Only use it when the elements do not depend on each other.
+        """
+        if parallel:
+            loads = list(loads)
+            with ThreadPoolExecutor(max_workers=min(4, len(loads) or 1)) as executor:
+                # consume results to re-raise the first loader error
+                list(executor.map(self.load, loads))
+            return
+        for is_sql_file, group in itertools.groupby(loads, key=lambda load: isinstance(load, Path)):
+            if is_sql_file:
+                sql_many(
+                    group,  # type: ignore[arg-type]
+                    host=self.host,
+                    port=self.port,
+                    user=self.user,
+                    dbname=self.dbname,
+                    password=self.password,
+                )
+            else:
+                for load in group:
+                    self.load(load)
+
+    def _connect(self, dbname: str) -> Connection:
+        """Connect to the given database, retrying while the server starts up."""
 
         def connect() -> Connection:
             return psycopg.connect(
@@ -174,6 +216,21 @@ class DatabaseJanitor(BaseDatabaseJanitor):
             conn.isolation_level = self.isolation_level
         # We must not run a transaction since we create a database.
         conn.autocommit = True
+        return conn
+
+    @contextmanager
+    def cursor(self, dbname: str = "postgres") -> Iterator[Cursor]:
+        """Return postgresql cursor.
+
+        Within the janitor's context, cursors on the postgres database share one connection.
+        """
+        if dbname == "postgres" and self._reuse_admin_conn:
+            if self._admin_conn is None or self._admin_conn.closed:
+                self._admin_conn = self._connect(dbname)
+            with self._admin_conn.cursor() as cur:
+                yield cur
+            return
+        conn = self._connect(dbname)
         cur = conn.cursor()
         try:
             yield cur
@@ -181,9 +238,51 @@ class DatabaseJanitor(BaseDatabaseJanitor):
             cur.close()
             conn.close()
 
+    def _with_admin_cursor(self, operation: Callable[[Cursor], None]) -> None:
+        """Run the operation with a cursor on the postgres database.
+
+        The shared connection may have been dropped by the server while idle
+        (idle_session_timeout, pg_terminate_backend, a restart), which psycopg only
+        notices once it is used. It is then discarded and the operation retried once
+        on a new connection. Errors reported by the server on a live connection
+        (e.g. object in use, lock timeout) are raised as they are.
+        """
+        reusing = self._reuse_admin_conn and self._admin_conn is not None and not self._admin_conn.closed
+        try:
+            with self.cursor() as cur:
+                operation(cur)
+        except psycopg.OperationalError:
+            # a connection interrupted by the server is always reported as closed
+            if not reusing or self._admin_conn is None or not self._admin_conn.closed:
+                raise
+            self._discard_admin_conn()
+            with self.cursor() as cur:
+                operation(cur)
+
+    def _discard_admin_conn(self) -> None:
+        """Close and forget the shared connection, so the next cursor opens a new one."""
+        if self._admin_conn is not None:
+            self._admin_conn.close()
+            self._admin_conn = None
+
+    def _close_admin_conn(self) -> None:
+        """Close the connection shared within the janitor's context."""
+        self._reuse_admin_conn = False
+        self._discard_admin_conn()
+
     def __enter__(self: DatabaseJanitorType) -> DatabaseJanitorType:
-        """Initialize Database Janitor."""
-        self.init()
+        """Initialize Database Janitor.
+
+        The connection to the postgres database opened for init() stays open until
+        the context exits and is reused by drop(), so it holds one idle server
+        connection for the lifetime of the context.
+        """
+        self._reuse_admin_conn = True
+        try:
+            self.init()
+        except BaseException:
+            self._close_admin_conn()
+            raise
         return self
 
     def __exit__(
@@ -193,21 +292,29 @@ class DatabaseJanitor(BaseDatabaseJanitor):
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit from Database janitor context cleaning after itself."""
-        self.drop()
+        try:
+            self.drop()
+        finally:
+            self._close_admin_conn()
 
 
 class AsyncDatabaseJanitor(BaseDatabaseJanitor):
     """Manage database state asynchronously for specific tasks."""
 
+    _admin_conn: psycopg.AsyncConnection | None = None
+    _reuse_admin_conn: bool = False
+
     async def init(self) -> None:
         """Create database in postgresql."""
-        async with self.cursor() as cur:
-            if self.template_dbname:
-                # And make sure no-one is left connected to the template database.
-                # Otherwise, Creating database from template will fail
-                await self._terminate_connection(cur, self.template_dbname)
-            query = self._build_create_database_sql()
-            await cur.execute(query)
+        await self._with_admin_cursor(self._create_database)
+
+    async def _create_database(self, cur: AsyncCursor) -> None:
+        if self.template_dbname:
+            # And make sure no-one is left connected to the template database.
+            # Otherwise, Creating database from template will fail
+            await self._terminate_connection(cur, self.template_dbname)
+        query = self._build_create_database_sql()
+        await cur.execute(query)
 
     @staticmethod
     async def _database_exists(cur: AsyncCursor, dbname: str) -> bool:
@@ -216,18 +323,18 @@ class AsyncDatabaseJanitor(BaseDatabaseJanitor):
 
     async def drop(self) -> None:
         """Drop database in postgresql."""
+        await self._with_admin_cursor(self._drop_database)
+
+    async def _drop_database(self, cur: AsyncCursor) -> None:
         # We cannot drop the database while there are connections to it, so we
         # terminate all connections first while not allowing new connections.
-        async with self.cursor() as cur:
-            if not await self._database_exists(cur, self.dbname):
-                return
-            await self._dont_datallowconn(cur, self.dbname)
-            await self._terminate_connection(cur, self.dbname)
-            if self.is_template():
-                await cur.execute(
-                    sql.SQL("ALTER DATABASE {} WITH is_template false").format(sql.Identifier(self.dbname))
-                )
-            await cur.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(self.dbname)))
+        if not await self._database_exists(cur, self.dbname):
+            return
+        await self._dont_datallowconn(cur, self.dbname)
+        await self._terminate_connection(cur, self.dbname)
+        if self.is_template():
+            await cur.execute(sql.SQL("ALTER DATABASE {} WITH is_template false").format(sql.Identifier(self.dbname)))
+        await cur.execute(sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier(self.dbname)))
 
     @staticmethod
     async def _dont_datallowconn(cur: AsyncCursor, dbname: str) -> None:
@@ -262,17 +369,15 @@ class AsyncDatabaseJanitor(BaseDatabaseJanitor):
         }
         loader_func = getattr(_loader, "func", _loader)
         if inspect.iscoroutinefunction(loader_func):
-            result = _loader(**loader_kwargs)
-            if inspect.isawaitable(result):
-                await result
-        else:
-            result = await asyncio.to_thread(_loader, **loader_kwargs)
-            if inspect.isawaitable(result):
-                await result
+            await _loader(**loader_kwargs)
+            return
+        # sync loaders may still return an awaitable, e.g. a coroutine of a helper they call
+        result = await asyncio.to_thread(_loader, **loader_kwargs)
+        if inspect.isawaitable(result):
+            await result
 
-    @asynccontextmanager
-    async def cursor(self, dbname: str = "postgres") -> AsyncIterator[AsyncCursor]:
-        """Return postgresql async cursor."""
+    async def _connect(self, dbname: str) -> psycopg.AsyncConnection:
+        """Connect to the given database, retrying while the server starts up."""
 
         async def connect() -> psycopg.AsyncConnection:
             return await psycopg.AsyncConnection.connect(
@@ -287,16 +392,77 @@ class AsyncDatabaseJanitor(BaseDatabaseJanitor):
         try:
             if self.isolation_level is not None:
                 await conn.set_isolation_level(self.isolation_level)
-            await conn.set_autocommit(True)
             # We must not run a transaction since we create a database.
+            await conn.set_autocommit(True)
+        except BaseException:
+            await conn.close()
+            raise
+        return conn
+
+    @asynccontextmanager
+    async def cursor(self, dbname: str = "postgres") -> AsyncIterator[AsyncCursor]:
+        """Return postgresql async cursor.
+
+        Within the janitor's context, cursors on the postgres database share one connection.
+        """
+        if dbname == "postgres" and self._reuse_admin_conn:
+            if self._admin_conn is None or self._admin_conn.closed:
+                self._admin_conn = await self._connect(dbname)
+            async with self._admin_conn.cursor() as cur:
+                yield cur
+            return
+        conn = await self._connect(dbname)
+        try:
             async with conn.cursor() as cur:
                 yield cur
         finally:
             await conn.close()
 
+    async def _with_admin_cursor(self, operation: Callable[[AsyncCursor], Awaitable[None]]) -> None:
+        """Run the operation with a cursor on the postgres database.
+
+        The shared connection may have been dropped by the server while idle
+        (idle_session_timeout, pg_terminate_backend, a restart), which psycopg only
+        notices once it is used. It is then discarded and the operation retried once
+        on a new connection. Errors reported by the server on a live connection
+        (e.g. object in use, lock timeout) are raised as they are.
+        """
+        reusing = self._reuse_admin_conn and self._admin_conn is not None and not self._admin_conn.closed
+        try:
+            async with self.cursor() as cur:
+                await operation(cur)
+        except psycopg.OperationalError:
+            # a connection interrupted by the server is always reported as closed
+            if not reusing or self._admin_conn is None or not self._admin_conn.closed:
+                raise
+            await self._discard_admin_conn()
+            async with self.cursor() as cur:
+                await operation(cur)
+
+    async def _discard_admin_conn(self) -> None:
+        """Close and forget the shared connection, so the next cursor opens a new one."""
+        if self._admin_conn is not None:
+            await self._admin_conn.close()
+            self._admin_conn = None
+
+    async def _close_admin_conn(self) -> None:
+        """Close the connection shared within the janitor's context."""
+        self._reuse_admin_conn = False
+        await self._discard_admin_conn()
+
     async def __aenter__(self: AsyncDatabaseJanitorType) -> AsyncDatabaseJanitorType:
-        """Initialize Async Database Janitor."""
-        await self.init()
+        """Initialize Async Database Janitor.
+
+        The connection to the postgres database opened for init() stays open until
+        the context exits and is reused by drop(), so it holds one idle server
+        connection for the lifetime of the context.
+        """
+        self._reuse_admin_conn = True
+        try:
+            await self.init()
+        except BaseException:
+            await self._close_admin_conn()
+            raise
         return self
 
     async def __aexit__(
@@ -306,4 +472,7 @@ class AsyncDatabaseJanitor(BaseDatabaseJanitor):
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit from Async Database Janitor context cleaning after itself."""
-        await self.drop()
+        try:
+            await self.drop()
+        finally:
+            await self._close_admin_conn()
@@ -1,44 +1,38 @@
 """Loader helper functions."""
 
+import asyncio
 import importlib
 import re
-from functools import partial
+from functools import cache, partial
 from pathlib import Path
-from types import ModuleType
-from typing import Any, Callable
+from typing import Any, Callable, Iterable
 
 import psycopg
 
-aiofiles: ModuleType | None
-try:
-    import aiofiles
-except ImportError:
-    aiofiles = None
+_LOADER_RE = re.compile("[.:]")
 
 
 def sql(sql_filename: Path, **kwargs: Any) -> None:
     """Database loader for sql files."""
+    sql_many([sql_filename], **kwargs)
+
+
+def sql_many(sql_filenames: Iterable[Path], **kwargs: Any) -> None:
+    """Database loader for several sql files sharing a single connection."""
     with psycopg.connect(**kwargs) as db_connection:
-        with open(sql_filename, "r") as _fd:
+        for sql_filename in sql_filenames:
             with db_connection.cursor() as cur:
-                cur.execute(_fd.read())
-        db_connection.commit()
+                cur.execute(Path(sql_filename).read_text())
+            db_connection.commit()
 
 
 async def sql_async(sql_filename: Path, **kwargs: Any) -> None:
-    """Async database loader for sql files.
-
-    Requires the optional ``async`` extra: ``pip install pytest-postgresql[async]``.
-    """
-    if aiofiles is None:
-        raise ImportError(
-            "aiofiles is required for async SQL loading. Install it with: pip install pytest-postgresql[async]"
-        )
-
+    """Async database loader for sql files."""
+    # Read the file in a worker thread so the event loop is not blocked.
+    query = await asyncio.to_thread(Path(sql_filename).read_text)
     async with await psycopg.AsyncConnection.connect(**kwargs) as db_connection:
         async with db_connection.cursor() as cur:
-            async with aiofiles.open(sql_filename, "r") as _fd:
-                await cur.execute(await _fd.read())
+            await cur.execute(query)
         await db_connection.commit()
 
 
@@ -51,11 +45,17 @@ def build_loader(
     if isinstance(load, Path):
         return partial(sql_loader, load)
     elif isinstance(load, str):
-        loader_parts = re.split("[.:]", load)
-        import_path = ".".join(loader_parts[:-1])
-        loader_name = loader_parts[-1]
-        _temp_import = importlib.import_module(import_path)
-        _loader: Callable = getattr(_temp_import, loader_name)
-        return _loader
+        return _resolve_string_loader(load)
     else:
         return load
+
+
+@cache
+def _resolve_string_loader(load: str) -> Callable:
+    """Import the callable pointed to by an import path, once per import path."""
+    loader_parts = _LOADER_RE.split(load)
+    import_path = ".".join(loader_parts[:-1])
+    loader_name = loader_parts[-1]
+    _temp_import = importlib.import_module(import_path)
+    _loader: Callable = getattr(_temp_import, loader_name)
+    return _loader
@@ -30,6 +30,7 @@ from packaging.version import Version
 
 from pytest_postgresql import factories
 from pytest_postgresql._asyncio_compat import supports_loop_factories
+from pytest_postgresql.config import _default_exec
 
 try:
     import pytest_asyncio
@@ -48,6 +49,9 @@ _help_unixsocketdir = "Location of the socket directory"
 _help_dbname = "Default database name"
 _help_load = "Dotted-style or entrypoint-style path to callable or path to SQL File"
 _help_postgres_options = "Postgres executable extra parameters. Passed via the -o option to pg_ctl"
+# Durability is pointless for a throwaway test server; fsync is already disabled with -F.
+_default_postgres_options = "-c full_page_writes=off -c synchronous_commit=off -c jit=off"
+_help_tmpfs = "Keep PostgreSQL data directory on tmpfs (/dev/shm). Linux only"
 _help_drop_test_database = (
     "Drop test database in noproc and client fixture, for the cases, "
     "when database was not cleared due to errors in previous test runs. "
@@ -138,7 +142,7 @@ if _is_windows():
 
 def pytest_addoption(parser: Parser) -> None:
     """Configure options for pytest-postgresql."""
-    parser.addini(name="postgresql_exec", help=_help_executable, default="/usr/lib/postgresql/14/bin/pg_ctl")
+    parser.addini(name="postgresql_exec", help=_help_executable, default=_default_exec)
 
     parser.addini(name="postgresql_host", help=_help_host, default="127.0.0.1")
 
@@ -162,7 +166,8 @@ def pytest_addoption(parser: Parser) -> None:
     parser.addini(name="postgresql_dbname", help=_help_dbname, default="tests")
 
     parser.addini(name="postgresql_load", type="pathlist", help=_help_load)
-    parser.addini(name="postgresql_postgres_options", help=_help_postgres_options, default="")
+    parser.addini(name="postgresql_postgres_options", help=_help_postgres_options, default=_default_postgres_options)
+    parser.addini(name="postgresql_tmpfs", type="bool", help=_help_tmpfs, default=False)
 
     parser.addoption(
         "--postgresql-exec",
@@ -218,6 +223,13 @@ def pytest_addoption(parser: Parser) -> None:
         help=_help_postgres_options,
     )
 
+    parser.addoption(
+        "--postgresql-tmpfs",
+        action="store_true",
+        dest="postgresql_tmpfs",
+        help=_help_tmpfs,
+    )
+
     parser.addoption(
         "--postgresql-drop-test-database",
         action="store_true",
@@ -2,11 +2,15 @@
 
 import asyncio
 import datetime
+import random
 from time import sleep
 from typing import Awaitable, Callable, Type, TypeVar
 
 T = TypeVar("T")
 
+_INITIAL_DELAY = 0.001
+_MAX_DELAY = 1.0
+
 
 def retry(
     func: Callable[[], T],
@@ -32,7 +36,7 @@ def retry(
         except possible_exception as e:
             if time + timeout_diff < get_current_datetime():
                 raise TimeoutError(f"Failed after {i} attempts") from e
-            sleep(1)
+            sleep(_backoff_delay(i))
         else:
             return res
 
@@ -61,11 +65,17 @@ async def retry_async(
         except possible_exception as e:
             if time + timeout_diff < get_current_datetime():
                 raise TimeoutError(f"Failed after {i} attempts") from e
-            await asyncio.sleep(1)
+            await asyncio.sleep(_backoff_delay(i))
         else:
             return res
 
 
+def _backoff_delay(attempt: int) -> float:
+    """Return the delay before the next attempt, doubling from 1ms up to 1s, with jitter."""
+    delay = min(_MAX_DELAY, _INITIAL_DELAY * 2.0 ** (attempt - 1))
+    return delay + random.uniform(0, delay / 10)
+
+
 def get_current_datetime() -> datetime.datetime:
     """Get the current timezone-aware UTC datetime."""
     return datetime.datetime.now(datetime.timezone.utc)
@@ -2,6 +2,10 @@
 
 import os
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import psycopg
+import pytest
 
 from pytest_postgresql import factories
 
@@ -13,8 +17,25 @@ TEST_SQL_DIR = os.path.dirname(os.path.abspath(__file__)) + "/test_sql/"
 TEST_SQL_FILE = Path(TEST_SQL_DIR + "test.sql")
 TEST_SQL_FILE2 = Path(TEST_SQL_DIR + "test2.sql")
 
+# used by test_postgresql.py only, grouped on one xdist worker there
 postgresql_proc2 = factories.postgresql_proc(port=None, load=[TEST_SQL_FILE, TEST_SQL_FILE2])
 postgresql2 = factories.postgresql("postgresql_proc2", dbname="test-db")
 postgresql_load_1 = factories.postgresql("postgresql_proc2")
 postgresql2_async = factories.postgresql_async("postgresql_proc2", dbname="test-db")
 postgresql_load_1_async = factories.postgresql_async("postgresql_proc2")
+
+
+@pytest.fixture
+def mock_psycopg_connect(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace psycopg.connect with a mock for tests that never reach a server."""
+    connect_mock = MagicMock()
+    monkeypatch.setattr(psycopg, "connect", connect_mock)
+    return connect_mock
+
+
+@pytest.fixture
+def mock_psycopg_async_connect(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Replace psycopg.AsyncConnection.connect with a mock for tests that never reach a server."""
+    connect_mock = AsyncMock()
+    monkeypatch.setattr(psycopg.AsyncConnection, "connect", connect_mock)
+    return connect_mock
@@ -5,7 +5,8 @@ from pathlib import Path
 import pytest
 from _pytest._py.path import LocalPath
 
-from pytest_postgresql.config import detect_paths
+from pytest_postgresql import plugin
+from pytest_postgresql.config import detect_paths, get_config
 
 
 @pytest.mark.parametrize(
@@ -19,3 +20,20 @@ from pytest_postgresql.config import detect_paths
 def test_detect_paths(path: str | LocalPath, want: Path | str) -> None:
     """Check the correctness of detect_paths function."""
     assert detect_paths([path]) == [want]
+
+
+def test_detect_paths_keeps_callables_and_paths() -> None:
+    """Check that detect_paths passes through elements given to the factories as they are."""
+    assert detect_paths([print, Path("load.py")]) == [print, Path("load.py")]
+
+
+def test_get_config_is_cached(request: pytest.FixtureRequest) -> None:
+    """Check that configuration is read only once per pytest session."""
+    assert get_config(request) is get_config(request)
+
+
+def test_default_postgres_options_disable_durability() -> None:
+    """Check that durability features are turned off by default for the test server."""
+    postgres_options = plugin._default_postgres_options
+    assert "-c full_page_writes=off" in postgres_options
+    assert "-c synchronous_commit=off" in postgres_options
@@ -1,6 +1,7 @@
 """Test various executor behaviours."""
 
 import logging
+import os
 import platform
 import tempfile
 from collections.abc import Iterator
@@ -17,10 +18,10 @@ from psycopg import Connection
 from pytest import FixtureRequest
 
 import pytest_postgresql.factories.process as process
-from pytest_postgresql.config import get_config
+from pytest_postgresql.config import _default_exec, get_config
 from pytest_postgresql.exceptions import PostgreSQLUnsupported
 from pytest_postgresql.executor import PostgreSQLExecutor
-from pytest_postgresql.factories import postgresql, postgresql_async, postgresql_proc
+from pytest_postgresql.factories import postgresql, postgresql_async, postgresql_proc, postgresql_rollback
 from pytest_postgresql.retry import retry
 
 
@@ -158,6 +159,50 @@ def test_init_directory_logs_password_file_cleanup_failure(
     assert executor._directory_initialised is True
 
 
+def test_postgresql_client_clones_template_database() -> None:
+    """Client fixture creates its database from the process template without reloading data."""
+    fixture_func = postgresql("postgresql_proc")
+    raw_func = getattr(fixture_func, "__wrapped__", fixture_func)
+
+    proc_mock = MagicMock()
+    proc_mock.dbname = "tests"
+    proc_mock.template_dbname = "tests_tmpl"
+
+    request_mock = MagicMock()
+    request_mock.getfixturevalue.return_value = proc_mock
+
+    janitor_mock = MagicMock()
+    janitor_mock.__enter__ = MagicMock(return_value=janitor_mock)
+    janitor_mock.__exit__ = MagicMock(return_value=False)
+
+    with (
+        patch("pytest_postgresql.factories.client.get_config") as get_config_mock,
+        patch("pytest_postgresql.factories.client.DatabaseJanitor", return_value=janitor_mock) as janitor_cls,
+        patch("pytest_postgresql.factories.client.psycopg.connect"),
+    ):
+        get_config_mock.return_value = MagicMock(drop_test_database=False)
+        list(raw_func(request_mock))
+
+    assert janitor_cls.call_args.kwargs["dbname"] == "tests"
+    assert janitor_cls.call_args.kwargs["template_dbname"] == "tests_tmpl"
+    janitor_mock.load.assert_not_called()
+
+
+def test_postgresql_rollback_wraps_test_in_rolled_back_transaction() -> None:
+    """Rollback fixture reuses the given connection inside a force-rollback transaction."""
+    fixture_func = postgresql_rollback("postgresql_session")
+    raw_func = getattr(fixture_func, "__wrapped__", fixture_func)
+
+    conn_mock = MagicMock()
+    request_mock = MagicMock()
+    request_mock.getfixturevalue.return_value = conn_mock
+
+    assert list(raw_func(request_mock)) == [conn_mock]
+    request_mock.getfixturevalue.assert_called_once_with("postgresql_session")
+    conn_mock.transaction.assert_called_once_with(force_rollback=True)
+    conn_mock.transaction.return_value.__exit__.assert_called_once()
+
+
 def test_postgresql_client_closes_on_pre_yield_failure() -> None:
     """Sync client fixture closes the connection when setup fails before yield."""
     fixture_func = postgresql("postgresql_proc", isolation_level=psycopg.IsolationLevel.SERIALIZABLE)
@@ -484,6 +529,17 @@ def _isolated_port_basetemp(
         yield port_path
 
 
+def _process_config_mock(port_search_count: int = 5) -> MagicMock:
+    """Return a config mock for driving the process fixture without a server, using the default datadir."""
+    config_mock = MagicMock()
+    config_mock.dbname = "tests"
+    config_mock.load = []
+    config_mock.drop_test_database = False
+    config_mock.port_search_count = port_search_count
+    config_mock.tmpfs = False
+    return config_mock
+
+
 def test_postgresql_proc_removes_port_lock_on_teardown(
     request: FixtureRequest,
     tmp_path_factory: pytest.TempPathFactory,
@@ -522,12 +578,7 @@ def test_postgresql_proc_removes_port_lock_on_teardown(
             patch("pytest_postgresql.factories.process.get_config") as get_config_mock,
             patch.object(request, "addfinalizer", side_effect=finalizers.append),
         ):
-            config_mock = MagicMock()
-            config_mock.dbname = "tests"
-            config_mock.load = []
-            config_mock.drop_test_database = False
-            config_mock.port_search_count = 5
-            get_config_mock.return_value = config_mock
+            get_config_mock.return_value = _process_config_mock()
 
             raw_func(request, tmp_path_factory)
             port_file = port_path / f"postgresql-{pg_port}.port"
@@ -538,6 +589,42 @@ def test_postgresql_proc_removes_port_lock_on_teardown(
         assert not port_file.exists()
 
 
+def test_postgresql_proc_places_datadir_in_shm_with_tmpfs(
+    request: FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+    tmp_path: Path,
+) -> None:
+    """With tmpfs enabled, the process fixture starts PostgreSQL with its datadir under /dev/shm on Linux."""
+    fixture_func = postgresql_proc(port=None)
+    raw_func = getattr(fixture_func, "__wrapped__", fixture_func)
+
+    with _isolated_port_basetemp(tmp_path_factory, request, tmp_path):
+        pg_port = get_port(None)
+        assert pg_port is not None
+
+        config_mock = _process_config_mock()
+        config_mock.tmpfs = True
+        finalizers: list[Callable[[], None]] = []
+
+        with (
+            patch("pytest_postgresql.factories.process._pg_exe", return_value="/usr/bin/pg_ctl"),
+            patch("pytest_postgresql.factories.process._pg_port", return_value=pg_port),
+            patch("pytest_postgresql.factories.process.platform.system", return_value="Linux"),
+            patch("pytest_postgresql.factories.process.os.path.isdir", return_value=True),
+            patch("pytest_postgresql.factories.process.PostgreSQLExecutor") as executor_cls,
+            patch("pytest_postgresql.factories.process.DatabaseJanitor"),
+            patch("pytest_postgresql.factories.process.get_config", return_value=config_mock),
+            patch.object(request, "addfinalizer", side_effect=finalizers.append),
+        ):
+            raw_func(request, tmp_path_factory)
+            for finalizer in finalizers:
+                finalizer()
+
+        datadir = Path(executor_cls.call_args.kwargs["datadir"])
+        assert datadir.parent == Path("/dev/shm")
+        assert datadir.name.endswith(f"-{pg_port}")
+
+
 def test_postgresql_proc_removes_port_lock_on_setup_failure(
     request: FixtureRequest,
     tmp_path_factory: pytest.TempPathFactory,
@@ -557,12 +644,7 @@ def test_postgresql_proc_removes_port_lock_on_setup_failure(
             patch("pytest_postgresql.factories.process.get_config") as get_config_mock,
             patch.object(tmp_path_factory, "mktemp", side_effect=OSError("setup failed")),
         ):
-            config_mock = MagicMock()
-            config_mock.dbname = "tests"
-            config_mock.load = []
-            config_mock.drop_test_database = False
-            config_mock.port_search_count = 5
-            get_config_mock.return_value = config_mock
+            get_config_mock.return_value = _process_config_mock()
 
             with pytest.raises(OSError, match="setup failed"):
                 raw_func(request, tmp_path_factory)
@@ -608,12 +690,7 @@ def test_postgresql_proc_stops_executor_on_setup_failure_after_start(
             patch("pytest_postgresql.factories.process.DatabaseJanitor", return_value=janitor_mock),
             patch("pytest_postgresql.factories.process.get_config") as get_config_mock,
         ):
-            config_mock = MagicMock()
-            config_mock.dbname = "tests"
-            config_mock.load = []
-            config_mock.drop_test_database = False
-            config_mock.port_search_count = 5
-            get_config_mock.return_value = config_mock
+            get_config_mock.return_value = _process_config_mock()
 
             with pytest.raises(RuntimeError, match="init failed"):
                 raw_func(request, tmp_path_factory)
@@ -662,12 +739,7 @@ def test_postgresql_proc_cleanup_stops_executor_when_drop_fails(
             patch("pytest_postgresql.factories.process.get_config") as get_config_mock,
             patch.object(request, "addfinalizer", side_effect=finalizers.append),
         ):
-            config_mock = MagicMock()
-            config_mock.dbname = "tests"
-            config_mock.load = []
-            config_mock.drop_test_database = False
-            config_mock.port_search_count = 5
-            get_config_mock.return_value = config_mock
+            get_config_mock.return_value = _process_config_mock()
 
             raw_func(request, tmp_path_factory)
             port_file = port_path / f"postgresql-{pg_port}.port"
@@ -700,12 +772,7 @@ def test_postgresql_proc_port_lock_safe_on_pg_port_failure(
             ),
             patch("pytest_postgresql.factories.process.get_config") as get_config_mock,
         ):
-            config_mock = MagicMock()
-            config_mock.dbname = "tests"
-            config_mock.load = []
-            config_mock.drop_test_database = False
-            config_mock.port_search_count = 5
-            get_config_mock.return_value = config_mock
+            get_config_mock.return_value = _process_config_mock()
 
             with pytest.raises(PortForException, match="no free ports"):
                 raw_func(request, tmp_path_factory)
@@ -743,12 +810,7 @@ def test_postgresql_proc_preserves_foreign_port_lock_on_exhausted_retries(
                 patch("pytest_postgresql.factories.process._pg_port", side_effect=pg_ports),
                 patch("pytest_postgresql.factories.process.get_config") as get_config_mock,
             ):
-                config_mock = MagicMock()
-                config_mock.dbname = "tests"
-                config_mock.load = []
-                config_mock.drop_test_database = False
-                config_mock.port_search_count = 2
-                get_config_mock.return_value = config_mock
+                get_config_mock.return_value = _process_config_mock(port_search_count=2)
 
                 with pytest.raises(PortForException, match="Attempted"):
                     raw_func(request, tmp_path_factory)
@@ -906,3 +968,80 @@ def test_prepare_dir_creates_datadir_on_freebsd(tmp_path: Path) -> None:
 
     assert datadir.exists()
     assert (datadir / "pg_hba.conf").read_text(encoding="utf-8").endswith("host all all 0.0.0.0/0 trust\n")
+
+
+def test_prepare_dir_uses_shm_datadir_with_tmpfs_on_linux(tmp_path: Path) -> None:
+    """Linux keeps pgdata in /dev/shm when tmpfs is requested."""
+    with (
+        patch("pytest_postgresql.factories.process.platform.system", return_value="Linux"),
+        patch("pytest_postgresql.factories.process.os.path.isdir", return_value=True),
+    ):
+        datadir, logfile_path = process._prepare_dir(tmp_path, 5432, "12345", tmpfs=True)
+
+    assert datadir == Path("/dev/shm") / "pytest-postgresql-data-12345-5432"
+    assert logfile_path == tmp_path / "postgresql.5432.log"
+    assert not datadir.exists()
+
+
+@pytest.fixture
+def clear_pg_ctl_cache() -> Iterator[None]:
+    """Clear the cached pg_ctl lookup before and after a test."""
+    process._find_pg_ctl.cache_clear()
+    yield
+    process._find_pg_ctl.cache_clear()
+
+
+@pytest.mark.usefixtures("clear_pg_ctl_cache")
+def test_pg_exe_uses_pg_ctl_from_path_before_pg_config(monkeypatch: pytest.MonkeyPatch) -> None:
+    """pg_ctl found on PATH is used without running pg_config, and the lookup is cached."""
+    config = MagicMock(exec="/nonexistent/pg_ctl")
+    monkeypatch.delenv("PG_BINDIR", raising=False)
+    with (
+        patch("pytest_postgresql.factories.process.shutil.which", return_value="/opt/pg/bin/pg_ctl") as which,
+        patch("pytest_postgresql.factories.process.subprocess.check_output") as check_output,
+    ):
+        assert process._pg_exe(None, config) == "/opt/pg/bin/pg_ctl"
+        assert process._pg_exe(None, config) == "/opt/pg/bin/pg_ctl"
+    which.assert_called_once_with("pg_ctl")
+    check_output.assert_not_called()
+
+
+@pytest.mark.usefixtures("clear_pg_ctl_cache")
+def test_pg_exe_uses_pg_bindir_environment_variable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """PG_BINDIR points straight at pg_ctl, skipping PATH lookup and pg_config."""
+    config = MagicMock(exec="/nonexistent/pg_ctl")
+    monkeypatch.setenv("PG_BINDIR", "/opt/pg/bin")
+    with (
+        patch("pytest_postgresql.factories.process.shutil.which") as which,
+        patch("pytest_postgresql.factories.process.subprocess.check_output") as check_output,
+    ):
+        assert process._pg_exe(None, config) == os.path.join("/opt/pg/bin", "pg_ctl")
+    which.assert_not_called()
+    check_output.assert_not_called()
+
+
+@pytest.mark.usefixtures("clear_pg_ctl_cache")
+def test_pg_exe_prefers_pg_bindir_over_default_executable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """PG_BINDIR wins over the built-in postgresql_exec default, even when that path exists."""
+    config = MagicMock(exec=_default_exec)
+    monkeypatch.setenv("PG_BINDIR", "/opt/pg/bin")
+    with patch("pytest_postgresql.factories.process.os.path.exists", return_value=True):
+        assert process._pg_exe(None, config) == os.path.join("/opt/pg/bin", "pg_ctl")
+
+
+@pytest.mark.usefixtures("clear_pg_ctl_cache")
+def test_pg_exe_prefers_configured_executable_over_pg_bindir(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An explicitly configured, existing postgresql_exec wins over PG_BINDIR."""
+    config = MagicMock(exec="/opt/custom/bin/pg_ctl")
+    monkeypatch.setenv("PG_BINDIR", "/opt/pg/bin")
+    with patch("pytest_postgresql.factories.process.os.path.exists", return_value=True):
+        assert process._pg_exe(None, config) == "/opt/custom/bin/pg_ctl"
+
+
+def test_claimed_ports_reads_port_files(tmp_path: Path) -> None:
+    """Ports claimed through port files are collected, unrelated files are ignored."""
+    (tmp_path / "postgresql-8765.port").write_text("pg_port 8765\n", encoding="utf-8")
+    (tmp_path / "postgresql-8766.port").write_text("pg_port 8766\n", encoding="utf-8")
+    (tmp_path / "postgresql-unknown.port").write_text("", encoding="utf-8")
+
+    assert process._claimed_ports(tmp_path) == {8765, 8766}
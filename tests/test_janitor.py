@@ -1,11 +1,13 @@
 """Database Janitor tests."""
 
+import itertools
 import sys
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import psycopg
+import psycopg.sql as sql
 import pytest
 from packaging.version import parse
 from psycopg import AsyncCursor
@@ -20,101 +22,199 @@ VERSION = parse("10")
 TEST_PASSWORD = "some_password"  # noqa: S105
 
 
-@pytest.mark.parametrize("version", (VERSION, 10, "10"))
-def test_version_cast(version: Any) -> None:
-    """Test that version is cast to Version object."""
-    janitor = DatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=version)
-    assert janitor.version == VERSION
+@pytest.fixture(scope="module")
+def base_janitor_kwargs() -> dict[str, Any]:
+    """Return connection arguments shared by janitors that never reach a server."""
+    return {"user": "user", "host": "host", "port": "1234", "dbname": "database_name"}
 
 
-@pytest.mark.parametrize("version", (VERSION, 10, "10"))
-@pytest.mark.asyncio
-async def test_version_cast_async(version: Any) -> None:
-    """Async test that version is cast to Version object."""
-    janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=version)
+@pytest.fixture(params=(DatabaseJanitor, AsyncDatabaseJanitor), ids=("sync", "async"))
+def janitor_cls(request: pytest.FixtureRequest) -> type[DatabaseJanitor | AsyncDatabaseJanitor]:
+    """Return each janitor class for tests that only exercise construction."""
+    return request.param  # type: ignore[no-any-return]
+
+
+@pytest.mark.parametrize("version", (VERSION, 10, "10"), ids=("Version", "int", "str"))
+def test_version_cast(
+    janitor_cls: type[DatabaseJanitor | AsyncDatabaseJanitor], base_janitor_kwargs: dict[str, Any], version: Any
+) -> None:
+    """Test that version is cast to Version object."""
+    janitor = janitor_cls(**base_janitor_kwargs, version=version)
     assert janitor.version == VERSION
 
 
-@patch("pytest_postgresql.janitor.psycopg.connect")
-def test_cursor_selects_postgres_database(connect_mock: MagicMock) -> None:
+def test_cursor_selects_postgres_database(mock_psycopg_connect: MagicMock, base_janitor_kwargs: dict[str, Any]) -> None:
     """Test that the cursor requests the postgres database."""
-    janitor = DatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    janitor = DatabaseJanitor(**base_janitor_kwargs, version=10)
     with janitor.cursor():
-        connect_mock.assert_called_once_with(dbname="postgres", user="user", password=None, host="host", port="1234")
+        mock_psycopg_connect.assert_called_once_with(
+            dbname="postgres", user="user", password=None, host="host", port="1234"
+        )
 
 
 @pytest.mark.asyncio
-async def test_cursor_selects_postgres_database_async() -> None:
+async def test_cursor_selects_postgres_database_async(
+    base_janitor_kwargs: dict[str, Any], mock_psycopg_async_connect: AsyncMock
+) -> None:
     """Async test that the cursor requests the postgres database."""
     conn_mock = _make_async_conn_mock()
-    connect_mock = AsyncMock(return_value=conn_mock)
-    with patch("pytest_postgresql.janitor.psycopg.AsyncConnection.connect", connect_mock):
-        janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
-        async with janitor.cursor():
-            connect_mock.assert_called_once_with(
-                dbname="postgres", user="user", password=None, host="host", port="1234"
-            )
+    mock_psycopg_async_connect.return_value = conn_mock
+    janitor = AsyncDatabaseJanitor(**base_janitor_kwargs, version=10)
+    async with janitor.cursor():
+        mock_psycopg_async_connect.assert_called_once_with(
+            dbname="postgres", user="user", password=None, host="host", port="1234"
+        )
 
 
-@patch("pytest_postgresql.janitor.psycopg.connect")
-def test_cursor_connects_with_password(connect_mock: MagicMock) -> None:
-    """Test that the cursor requests the postgres database."""
-    janitor = DatabaseJanitor(
-        user="user",
-        host="host",
-        port="1234",
-        dbname="database_name",
-        version=10,
-        password=TEST_PASSWORD,
+def test_janitor_context_shares_admin_connection(mock_psycopg_connect: MagicMock) -> None:
+    """init() and drop() within the janitor's context reuse a single admin connection."""
+    mock_psycopg_connect.return_value.closed = False
+    janitor = DatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    with janitor:
+        pass
+    mock_psycopg_connect.assert_called_once_with(
+        dbname="postgres", user="user", password=None, host="host", port="1234"
+    )
+    mock_psycopg_connect.return_value.close.assert_called_once()
+
+    janitor.init()
+    assert mock_psycopg_connect.call_count == 2, "outside of the context every call connects on its own"
+
+
+DROP_DATABASE_SQL = sql.SQL("DROP DATABASE IF EXISTS {}").format(sql.Identifier("database_name"))
+
+
+def _fail_once_executed(conn: MagicMock, error: psycopg.OperationalError, *, close: bool) -> Callable[..., None]:
+    """Return an execute side effect passing CREATE DATABASE, then failing, optionally closing the connection."""
+    calls = itertools.count()
+
+    def execute(*args: Any, **kwargs: Any) -> None:
+        if next(calls):
+            conn.closed = close
+            raise error
+
+    return execute
+
+
+def test_janitor_context_replaces_dropped_admin_connection(mock_psycopg_connect: MagicMock) -> None:
+    """A shared admin connection dropped by the server is replaced once it fails."""
+    dead_conn, new_conn = MagicMock(closed=False), MagicMock(closed=False)
+    mock_psycopg_connect.side_effect = [dead_conn, new_conn]
+    dead_conn.cursor.return_value.__enter__.return_value.execute.side_effect = _fail_once_executed(
+        dead_conn, psycopg.OperationalError("server closed the connection unexpectedly"), close=True
     )
+    janitor = DatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    with janitor:
+        pass
+
+    assert mock_psycopg_connect.call_count == 2
+    dead_conn.close.assert_called_once()
+    new_cur = new_conn.cursor.return_value.__enter__.return_value
+    assert new_cur.execute.call_args.args[0] == DROP_DATABASE_SQL
+    new_conn.close.assert_called_once()
+
+
+def test_janitor_context_raises_server_errors_on_live_admin_connection(mock_psycopg_connect: MagicMock) -> None:
+    """An error reported on a still open admin connection is raised without rerunning the statements."""
+    mock_psycopg_connect.return_value.closed = False
+    error = psycopg.errors.ObjectInUse("database is being accessed by other users")
+    mock_psycopg_connect.return_value.cursor.return_value.__enter__.return_value.execute.side_effect = (
+        _fail_once_executed(mock_psycopg_connect.return_value, error, close=False)
+    )
+    janitor = DatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    with pytest.raises(psycopg.errors.ObjectInUse):
+        with janitor:
+            pass
+
+    mock_psycopg_connect.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_async_janitor_context_replaces_dropped_admin_connection(mock_psycopg_async_connect: AsyncMock) -> None:
+    """A shared async admin connection dropped by the server is replaced once it fails."""
+    dead_conn, new_conn = _make_async_conn_mock(), _make_async_conn_mock()
+    dead_conn.closed = new_conn.closed = False
+    dead_cur, new_cur = AsyncMock(spec=AsyncCursor), AsyncMock(spec=AsyncCursor)
+    dead_conn.cursor.return_value.__aenter__.return_value = dead_cur
+    new_conn.cursor.return_value.__aenter__.return_value = new_cur
+    mock_psycopg_async_connect.side_effect = [dead_conn, new_conn]
+    dead_cur.execute.side_effect = _fail_once_executed(
+        dead_conn, psycopg.OperationalError("server closed the connection unexpectedly"), close=True
+    )
+    janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    async with janitor:
+        pass
+
+    assert mock_psycopg_async_connect.await_count == 2
+    dead_conn.close.assert_awaited_once()
+    assert new_cur.execute.call_args.args[0] == DROP_DATABASE_SQL
+    new_conn.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_async_janitor_context_raises_server_errors_on_live_admin_connection(
+    mock_psycopg_async_connect: AsyncMock,
+) -> None:
+    """An error reported on a still open async admin connection is raised without rerunning the statements."""
+    conn = _make_async_conn_mock()
+    conn.closed = False
+    cur = AsyncMock(spec=AsyncCursor)
+    conn.cursor.return_value.__aenter__.return_value = cur
+    mock_psycopg_async_connect.return_value = conn
+    cur.execute.side_effect = _fail_once_executed(
+        conn, psycopg.errors.ObjectInUse("database is being accessed by other users"), close=False
+    )
+    janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    with pytest.raises(psycopg.errors.ObjectInUse):
+        async with janitor:
+            pass
+
+    mock_psycopg_async_connect.assert_awaited_once()
+
+
+def test_cursor_connects_with_password(mock_psycopg_connect: MagicMock, base_janitor_kwargs: dict[str, Any]) -> None:
+    """Test that the cursor requests the postgres database."""
+    janitor = DatabaseJanitor(**base_janitor_kwargs, version=10, password=TEST_PASSWORD)
     with janitor.cursor():
-        connect_mock.assert_called_once_with(
+        mock_psycopg_connect.assert_called_once_with(
             dbname="postgres", user="user", password=TEST_PASSWORD, host="host", port="1234"
         )
 
 
 @pytest.mark.asyncio
-async def test_cursor_connects_with_password_async() -> None:
+async def test_cursor_connects_with_password_async(
+    base_janitor_kwargs: dict[str, Any], mock_psycopg_async_connect: AsyncMock
+) -> None:
     """Async test that the cursor requests the postgres database with password."""
     conn_mock = _make_async_conn_mock()
-    connect_mock = AsyncMock(return_value=conn_mock)
-    with patch("pytest_postgresql.janitor.psycopg.AsyncConnection.connect", connect_mock):
-        janitor = AsyncDatabaseJanitor(
-            user="user",
-            host="host",
-            port="1234",
-            dbname="database_name",
-            version=10,
-            password=TEST_PASSWORD,
+    mock_psycopg_async_connect.return_value = conn_mock
+    janitor = AsyncDatabaseJanitor(**base_janitor_kwargs, version=10, password=TEST_PASSWORD)
+    async with janitor.cursor():
+        mock_psycopg_async_connect.assert_called_once_with(
+            dbname="postgres", user="user", password=TEST_PASSWORD, host="host", port="1234"
         )
-        async with janitor.cursor():
-            connect_mock.assert_called_once_with(
-                dbname="postgres", user="user", password=TEST_PASSWORD, host="host", port="1234"
-            )
 
 
 @pytest.mark.asyncio
-async def test_cursor_custom_dbname_async() -> None:
+async def test_cursor_custom_dbname_async(mock_psycopg_async_connect: AsyncMock) -> None:
     """Test that a custom dbname is forwarded to the connection in AsyncDatabaseJanitor.cursor."""
     conn_mock = _make_async_conn_mock()
-    connect_mock = AsyncMock(return_value=conn_mock)
-    with patch("pytest_postgresql.janitor.psycopg.AsyncConnection.connect", connect_mock):
-        janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
-        async with janitor.cursor(dbname="custom_db"):
-            connect_mock.assert_called_once_with(
-                dbname="custom_db", user="user", password=None, host="host", port="1234"
-            )
+    mock_psycopg_async_connect.return_value = conn_mock
+    janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    async with janitor.cursor(dbname="custom_db"):
+        mock_psycopg_async_connect.assert_called_once_with(
+            dbname="custom_db", user="user", password=None, host="host", port="1234"
+        )
 
 
 @pytest.mark.asyncio
-async def test_cursor_skips_isolation_level_when_none_async() -> None:
+async def test_cursor_skips_isolation_level_when_none_async(mock_psycopg_async_connect: AsyncMock) -> None:
     """Async cursor must not call set_isolation_level when isolation_level is None."""
     conn_mock = _make_async_conn_mock()
-    connect_mock = AsyncMock(return_value=conn_mock)
-    with patch("pytest_postgresql.janitor.psycopg.AsyncConnection.connect", connect_mock):
-        janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
-        async with janitor.cursor():
-            pass
+    mock_psycopg_async_connect.return_value = conn_mock
+    janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    async with janitor.cursor():
+        pass
 
     conn_mock.set_isolation_level.assert_not_called()
     conn_mock.set_autocommit.assert_called_once_with(True)
@@ -122,8 +222,7 @@ async def test_cursor_skips_isolation_level_when_none_async() -> None:
 
 @pytest.mark.skipif(sys.version_info < (3, 8), reason="Unittest call_args.kwargs was introduced since python 3.8")
 @pytest.mark.parametrize("load_database", ("tests.loader.load_database", "tests.loader:load_database"))
-@patch("pytest_postgresql.janitor.psycopg.connect")
-def test_janitor_populate(connect_mock: MagicMock, load_database: str) -> None:
+def test_janitor_populate(mock_psycopg_connect: MagicMock, load_database: str) -> None:
     """Test that the cursor requests the postgres database.
 
     load_database tries to connect to database, which triggers mocks.
@@ -137,15 +236,50 @@ def test_janitor_populate(connect_mock: MagicMock, load_database: str) -> None:
     }
     janitor = DatabaseJanitor(version=10, **call_kwargs)  # type: ignore[arg-type]
     janitor.load(load_database)
-    assert connect_mock.called
-    assert connect_mock.call_args.kwargs == call_kwargs
+    assert mock_psycopg_connect.called
+    assert mock_psycopg_connect.call_args.kwargs == call_kwargs
+
+
+def test_janitor_load_many_shares_connection_for_sql_files(mock_psycopg_connect: MagicMock) -> None:
+    """Consecutive sql files are loaded over one connection, in the given order."""
+    call_kwargs = {
+        "host": "host",
+        "port": "1234",
+        "user": "user",
+        "dbname": "database_name",
+        "password": TEST_PASSWORD,
+    }
+    execute_mock = (
+        mock_psycopg_connect.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value.execute
+    )
+    loader_mock = MagicMock()
+    janitor = DatabaseJanitor(version=10, **call_kwargs)  # type: ignore[arg-type]
+
+    janitor.load_many([TEST_SQL_FILE, TEST_SQL_FILE, loader_mock, TEST_SQL_FILE])
+
+    assert mock_psycopg_connect.call_count == 2
+    assert mock_psycopg_connect.call_args.kwargs == call_kwargs
+    assert execute_mock.call_count == 3
+    loader_mock.assert_called_once_with(**call_kwargs)
+
+
+def test_janitor_load_many_parallel() -> None:
+    """Parallel loading calls every loader and re-raises loader errors."""
+    janitor = DatabaseJanitor(user="user", host="host", port="1234", dbname="database_name", version=10)
+    loaders = [MagicMock() for _ in range(3)]
+    janitor.load_many(loaders, parallel=True)
+    for loader in loaders:
+        loader.assert_called_once()
+
+    failing_loader = MagicMock(side_effect=RuntimeError("load failed"))
+    with pytest.raises(RuntimeError, match="load failed"):
+        janitor.load_many([MagicMock(), failing_loader], parallel=True)
 
 
 @pytest.mark.skipif(sys.version_info < (3, 8), reason="Unittest call_args.kwargs was introduced since python 3.8")
 @pytest.mark.parametrize("load_database", ("tests.loader.load_database", "tests.loader:load_database"))
-@patch("tests.loader.psycopg.connect")
 @pytest.mark.asyncio
-async def test_janitor_populate_async(connect_mock: MagicMock, load_database: str) -> None:
+async def test_janitor_populate_async(mock_psycopg_connect: MagicMock, load_database: str) -> None:
     """Async test that the cursor requests the postgres database and populates.
 
     load_database (synchronous) uses psycopg.connect, so we mock that.
@@ -159,8 +293,8 @@ async def test_janitor_populate_async(connect_mock: MagicMock, load_database: st
     }
     janitor = AsyncDatabaseJanitor(version=10, **call_kwargs)  # type: ignore[arg-type]
     await janitor.load(load_database)
-    assert connect_mock.called
-    assert connect_mock.call_args.kwargs == call_kwargs
+    assert mock_psycopg_connect.called
+    assert mock_psycopg_connect.call_args.kwargs == call_kwargs
 
 
 @pytest.mark.asyncio
@@ -421,15 +555,6 @@ def test_janitor_drop_noop_when_database_missing() -> None:
     assert cur.execute.call_args.args[0] == "SELECT 1 FROM pg_database WHERE datname = %s"
 
 
-@pytest.mark.asyncio
-async def test_async_janitor_load_sql_path_raises_without_aiofiles() -> None:
-    """AsyncDatabaseJanitor.load() surfaces aiofiles ImportError for SQL file paths."""
-    janitor = AsyncDatabaseJanitor(user="user", host="host", port="1234", dbname="mydb", version=10)
-    with patch("pytest_postgresql.loader.aiofiles", None):
-        with pytest.raises(ImportError, match="aiofiles"):
-            await janitor.load(Path("dummy.sql"))
-
-
 def _make_async_conn_mock() -> MagicMock:
     """Create a MagicMock that behaves like a psycopg3 AsyncConnection."""
     conn = MagicMock()
@@ -2,10 +2,11 @@
 
 from pathlib import Path
 from types import ModuleType
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from pytest_postgresql import loader
 from pytest_postgresql.loader import build_loader, sql, sql_async
 from tests.loader import load_database
 
@@ -32,6 +33,19 @@ def test_loader_deeply_nested_import_path() -> None:
     assert result is sentinel
 
 
+def test_loader_import_path_resolved_once() -> None:
+    """The same import path is imported only once across build_loader calls."""
+    sentinel = object()
+    fake_module = ModuleType("fake_module")
+    fake_module.cached_loader = sentinel  # type: ignore[attr-defined]
+    loader._resolve_string_loader.cache_clear()
+    with patch("pytest_postgresql.loader.importlib.import_module", return_value=fake_module) as import_mock:
+        assert build_loader("cached.module:cached_loader") is sentinel
+        assert build_loader("cached.module:cached_loader", sql_loader=sql_async) is sentinel
+    import_mock.assert_called_once_with("cached.module")
+    loader._resolve_string_loader.cache_clear()
+
+
 def test_loader_callables_with_async_sql_loader() -> None:
     """build_loader with sql_loader=sql_async resolves callables the same as the default."""
     assert load_database == build_loader(load_database, sql_loader=sql_async)
@@ -60,8 +74,18 @@ def test_loader_sql_async() -> None:
 
 
 @pytest.mark.asyncio
-async def test_sql_async_raises_without_aiofiles() -> None:
-    """sql_async raises ImportError with a helpful message when aiofiles is not installed."""
-    with patch("pytest_postgresql.loader.aiofiles", None):
-        with pytest.raises(ImportError, match="aiofiles"):
-            await sql_async(Path("dummy.sql"), host="h", port=5432, user="u", dbname="d")
+async def test_sql_async_executes_file_contents(tmp_path: Path, mock_psycopg_async_connect: AsyncMock) -> None:
+    """sql_async executes the whole sql file over a single connection and commits."""
+    sql_path = tmp_path / "load.sql"
+    sql_path.write_text("CREATE TABLE t (id int);\nINSERT INTO t VALUES (1);\n")
+    cur = MagicMock(execute=AsyncMock())
+    conn = MagicMock(commit=AsyncMock())
+    conn.__aenter__ = AsyncMock(return_value=conn)
+    conn.__aexit__ = AsyncMock(return_value=False)
+    conn.cursor.return_value.__aenter__ = AsyncMock(return_value=cur)
+    conn.cursor.return_value.__aexit__ = AsyncMock(return_value=False)
+    mock_psycopg_async_connect.return_value = conn
+    await sql_async(sql_path, host="h", port=5432, user="u", dbname="d")
+    mock_psycopg_async_connect.assert_awaited_once_with(host="h", port=5432, user="u", dbname="d")
+    cur.execute.assert_awaited_once_with(sql_path.read_text())
+    conn.commit.assert_awaited_once()
@@ -5,12 +5,21 @@ from packaging.version import parse
 from psycopg import AsyncConnection, Connection
 from psycopg.pq import ConnStatus
 
+from pytest_postgresql import factories
 from pytest_postgresql.executor import PostgreSQLExecutor
 from pytest_postgresql.retry import retry, retry_async
 from tests.conftest import POSTGRESQL_VERSION
 
 MAKE_Q = "CREATE TABLE test (id serial PRIMARY KEY, num integer, data varchar);"
 SELECT_Q = "SELECT * FROM test_load;"
+# polled repeatedly, so prepared once per connection
+CONNECTIONS_Q = "SELECT * FROM pg_stat_activity WHERE backend_type = 'client backend' AND datname = current_database();"
+
+# keep the postgresql_proc2 cluster from conftest on a single xdist worker
+pytestmark = pytest.mark.xdist_group(name="postgresql_proc2")
+
+postgresql_session = factories.postgresql("postgresql_proc", dbname="tests_rollback", scope="session")
+postgresql_rollback = factories.postgresql_rollback("postgresql_session")
 
 
 def test_postgresql_proc(postgresql_proc: PostgreSQLExecutor) -> None:
@@ -53,7 +62,16 @@ def test_rand_postgres_port(postgresql2: Connection) -> None:
     assert postgresql2.info.status == ConnStatus.OK
 
 
-@pytest.mark.xdist_group(name="terminate_connection")
+@pytest.mark.parametrize("_", range(2))
+def test_postgresql_rollback(postgresql_rollback: Connection, _: int) -> None:
+    """Check that changes made in one test are rolled back before the next one."""
+    with postgresql_rollback.cursor() as cur:
+        cur.execute(MAKE_Q)
+        cur.execute("INSERT INTO test (num, data) VALUES (1, 'rollback');")
+        cur.execute("SELECT count(*) FROM test;")
+        assert cur.fetchone() == (1,)
+
+
 @pytest.mark.parametrize("_", range(2))
 def test_postgres_terminate_connection(postgresql2: Connection, _: int) -> None:
     """Test that connections are terminated between tests.
@@ -63,9 +81,7 @@ def test_postgres_terminate_connection(postgresql2: Connection, _: int) -> None:
     with postgresql2.cursor() as cur:
 
         def check_if_one_connection() -> None:
-            cur.execute(
-                "SELECT * FROM pg_stat_activity WHERE backend_type = 'client backend' AND datname = current_database();"
-            )
+            cur.execute(CONNECTIONS_Q, prepare=True)
             existing_connections = cur.fetchall()
             assert len(existing_connections) == 1, f"there is always only one connection, {existing_connections}"
 
@@ -111,7 +127,6 @@ async def test_rand_postgres_port_async(postgresql2_async: AsyncConnection) -> N
     parse(POSTGRESQL_VERSION) < parse("10"),
     reason="Test query not supported in those postgresql versions, and soon will not be supported.",
 )
-@pytest.mark.xdist_group(name="terminate_connection")
 @pytest.mark.asyncio
 @pytest.mark.parametrize("_", range(2))
 async def test_postgres_terminate_connection_async(postgresql2_async: AsyncConnection, _: int) -> None:
@@ -122,9 +137,7 @@ async def test_postgres_terminate_connection_async(postgresql2_async: AsyncConne
     async with postgresql2_async.cursor() as cur:
 
         async def check_if_one_connection() -> None:
-            await cur.execute(
-                "SELECT * FROM pg_stat_activity WHERE backend_type = 'client backend' AND datname = current_database();"
-            )
+            await cur.execute(CONNECTIONS_Q, prepare=True)
             existing_connections = await cur.fetchall()
             assert len(existing_connections) == 1, f"there is always only one connection, {existing_connections}"
 
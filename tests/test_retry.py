@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from pytest_postgresql.retry import retry, retry_async
+from pytest_postgresql.retry import _backoff_delay, retry, retry_async
 
 
 def test_retry_immediate_success() -> None:
@@ -58,6 +58,14 @@ def test_retry_timeout() -> None:
     assert call_count == 2
 
 
+def test_retry_backoff_delay_grows_exponentially_up_to_cap() -> None:
+    """Delays start at about 1ms, double with each attempt and are capped at about 1s."""
+    with patch("pytest_postgresql.retry.random.uniform", return_value=0):
+        assert [_backoff_delay(attempt) for attempt in (1, 2, 3)] == [0.001, 0.002, 0.004]
+        assert _backoff_delay(20) == 1.0
+    assert 1.0 <= _backoff_delay(20) <= 1.1
+
+
 def test_retry_unmatched_exception_propagates() -> None:
     """Test that an exception not matching possible_exception propagates immediately."""
 
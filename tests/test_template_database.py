@@ -6,6 +6,11 @@ from psycopg import AsyncConnection, Connection
 from pytest_postgresql.factories import postgresql, postgresql_async, postgresql_proc
 from tests.loader import load_database
 
+pytestmark = pytest.mark.xdist_group(name="template_database")
+
+# one round trip: results are read back with nextset()
+TEMPLATE_CHECK_Q = "SELECT * FROM stories; TRUNCATE stories; SELECT * FROM stories"
+
 postgresql_proc_with_template = postgresql_proc(
     port=21987,
     dbname="stories_templated",
@@ -23,30 +28,28 @@ async_postgresql_template = postgresql_async(
 )
 
 
-@pytest.mark.xdist_group(name="template_database")
 @pytest.mark.parametrize("_", range(5))
 def test_template_database(postgresql_template: Connection, _: int) -> None:
     """Check that the database structure gets recreated out of a template."""
     with postgresql_template.cursor() as cur:
-        cur.execute("SELECT * FROM stories")
+        cur.execute(TEMPLATE_CHECK_Q)
         res = cur.fetchall()
         assert len(res) == 4
-        cur.execute("TRUNCATE stories")
-        cur.execute("SELECT * FROM stories")
+        cur.nextset()  # TRUNCATE
+        cur.nextset()
         res = cur.fetchall()
         assert len(res) == 0
 
 
-@pytest.mark.xdist_group(name="template_database")
 @pytest.mark.asyncio
 @pytest.mark.parametrize("_", range(5))
 async def test_template_database_async(async_postgresql_template: AsyncConnection, _: int) -> None:
     """Async check that the database structure gets recreated out of a template."""
     async with async_postgresql_template.cursor() as cur:
-        await cur.execute("SELECT * FROM stories")
+        await cur.execute(TEMPLATE_CHECK_Q)
         res = await cur.fetchall()
         assert len(res) == 4
-        await cur.execute("TRUNCATE stories")
-        await cur.execute("SELECT * FROM stories")
+        cur.nextset()  # TRUNCATE
+        cur.nextset()
         res = await cur.fetchall()
         assert len(res) == 0
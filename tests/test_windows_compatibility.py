@@ -1,66 +1,163 @@
 """Test Windows compatibility fixes for pytest-postgresql."""
 
 import os
+import platform
+import re
 import subprocess
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from pytest_postgresql.executor import PostgreSQLExecutor
 
+# positional and keyword arguments of a recorded call
+CallRecord = tuple[tuple[Any, ...], dict[str, Any]]
+
+UNIX_EXECUTOR_KWARGS: dict[str, Any] = {
+    "executable": "/usr/lib/postgresql/16/bin/pg_ctl",
+    "host": "localhost",
+    "port": 5432,
+    "datadir": "/tmp/data",
+    "unixsocketdir": "/tmp/socket",
+    "logfile": "/tmp/log",
+    "startparams": "-w",
+    "dbname": "test",
+}
+WINDOWS_EXECUTOR_KWARGS: dict[str, Any] = {
+    **UNIX_EXECUTOR_KWARGS,
+    "executable": "C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
+    "datadir": "C:/temp/data",
+    "unixsocketdir": "C:/temp/socket",
+    "logfile": "C:/temp/log",
+}
+PLATFORM_EXECUTOR_KWARGS: dict[str, dict[str, Any]] = {
+    "Linux": UNIX_EXECUTOR_KWARGS,
+    "Darwin": {**UNIX_EXECUTOR_KWARGS, "executable": "/opt/homebrew/bin/pg_ctl"},
+    "Windows": WINDOWS_EXECUTOR_KWARGS,
+}
+
+# parts of the Windows start command, in the order pg_ctl receives them
+WINDOWS_COMMAND_RE = re.compile(
+    ".*".join(
+        map(
+            re.escape,
+            (
+                '"C:/Program Files/PostgreSQL/bin/pg_ctl.exe" start',
+                '-D "C:/temp/data"',
+                '-o "-F -p 5555 -c log_destination=stderr',
+                "-c logging_collector=off",
+                '-c shared_preload_libraries=test"',
+                '-l "C:/temp/log.txt"',
+                "-w -s",
+            ),
+        )
+    )
+)
 
-class TestCommandTemplates:
-    """Test platform-specific command templates."""
 
-    def test_unix_command_template_has_single_quotes(self) -> None:
-        """Test that Unix template uses single quotes for PostgreSQL config values.
+@pytest.fixture
+def fake_windows(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report Windows from platform.system() for the duration of a test."""
+    monkeypatch.setattr(platform, "system", lambda: "Windows")
 
-        Single quotes are PostgreSQL config-level quoting that protects paths
-        with spaces in unix_socket_directories. On Unix, mirakuru uses
-        shlex.split() which properly handles single quotes inside double-quoted strings.
-        """
-        template = PostgreSQLExecutor.UNIX_PROC_START_COMMAND
 
-        # Unix template should use single quotes around config values
-        assert "log_destination='stderr'" in template
-        assert "unix_socket_directories='{unixsocketdir}'" in template
+@pytest.fixture
+def fake_linux(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report Linux from platform.system() for the duration of a test."""
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
 
-    def test_windows_command_template_no_single_quotes(self) -> None:
-        """Test that Windows template has no single quotes.
 
-        Windows cmd.exe treats single quotes as literal characters, not
-        delimiters, which causes errors when passed to pg_ctl.
-        """
-        template = PostgreSQLExecutor.WINDOWS_PROC_START_COMMAND
+@pytest.fixture(scope="module")
+def platform_executor(request: pytest.FixtureRequest) -> PostgreSQLExecutor:
+    """Return an executor built as if running on the platform passed as indirect parameter."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(platform, "system", lambda: request.param)
+        return PostgreSQLExecutor(**PLATFORM_EXECUTOR_KWARGS[request.param])
 
-        # Template itself must contain no single quotes and delegate the -o payload
-        # to the _windows_pg_options helper (tested below).
-        assert "'" not in template
-        assert "log_destination='stderr'" not in template
 
-        # The -o payload produced by the helper must use bare stderr (no single quotes)
-        # because cmd.exe treats single quotes as literal characters.
-        pg_options = PostgreSQLExecutor._windows_pg_options(5432, "")
-        assert "log_destination=stderr" in pg_options
-        assert "'" not in pg_options
+@pytest.fixture(scope="class")
+def executor() -> PostgreSQLExecutor:
+    """Return an executor shared by the tests of a class, none of which starts it."""
+    return PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "executable": "/path/to/pg_ctl"})
 
-    def test_windows_command_template_omits_unix_socket_directories(self) -> None:
-        """Test that Windows template does not include unix_socket_directories.
 
-        PostgreSQL ignores unix_socket_directories on Windows entirely, so
-        including it is unnecessary and avoids any quoting complexity.
-        """
-        template = PostgreSQLExecutor.WINDOWS_PROC_START_COMMAND
+@pytest.fixture
+def mock_process(executor: PostgreSQLExecutor, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Attach a mock limited to the subprocess.Popen interface as the executor's process."""
+    process = MagicMock(spec_set=subprocess.Popen)
+    monkeypatch.setattr(executor, "process", process)
+    return process
+
+
+@pytest.fixture
+def check_output_calls(monkeypatch: pytest.MonkeyPatch) -> list[CallRecord]:
+    """Replace subprocess.check_output with a stub and return the list of calls it receives."""
+    calls: list[CallRecord] = []
+
+    def check_output(*args: Any, **kwargs: Any) -> bytes:
+        calls.append((args, kwargs))
+        return b""
+
+    monkeypatch.setattr(subprocess, "check_output", check_output)
+    return calls
+
+
+@pytest.fixture
+def no_killpg(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Remove os.killpg, as on Windows, for the duration of a test."""
+    monkeypatch.delattr(os, "killpg", raising=False)
+
+
+class TestCommandTemplates:
+    """Test platform-specific command templates."""
 
-        assert "unix_socket_directories" not in template
-        assert "{unixsocketdir}" not in template
+    @pytest.mark.parametrize(
+        "template, needle, present",
+        (
+            # Single quotes are PostgreSQL config-level quoting that protects paths
+            # with spaces in unix_socket_directories. On Unix, mirakuru uses
+            # shlex.split() which properly handles single quotes inside double-quoted strings.
+            pytest.param(
+                PostgreSQLExecutor.UNIX_PROC_START_COMMAND, "log_destination='stderr'", True, id="unix-quoted-log"
+            ),
+            pytest.param(
+                PostgreSQLExecutor.UNIX_PROC_START_COMMAND,
+                "unix_socket_directories='{unixsocketdir}'",
+                True,
+                id="unix-socket-dir",
+            ),
+            # Windows cmd.exe treats single quotes as literal characters, not
+            # delimiters, which causes errors when passed to pg_ctl. The -o payload
+            # is delegated to the _windows_pg_options helper (tested below).
+            pytest.param(PostgreSQLExecutor.WINDOWS_PROC_START_COMMAND, "'", False, id="windows-no-quotes"),
+            # PostgreSQL ignores unix_socket_directories on Windows entirely, so
+            # including it is unnecessary and avoids any quoting complexity.
+            pytest.param(
+                PostgreSQLExecutor.WINDOWS_PROC_START_COMMAND,
+                "unix_socket_directories",
+                False,
+                id="windows-no-socket-dir",
+            ),
+            pytest.param(
+                PostgreSQLExecutor.WINDOWS_PROC_START_COMMAND, "{unixsocketdir}", False, id="windows-no-socket-field"
+            ),
+        ),
+    )
+    def test_command_template_contents(self, template: str, needle: str, present: bool) -> None:
+        """Test that each platform command template quotes config values the way its shell expects."""
+        assert (needle in template) is present
 
-    def test_unix_command_template_includes_unix_socket_directories(self) -> None:
-        """Test that Unix template includes unix_socket_directories."""
-        template = PostgreSQLExecutor.UNIX_PROC_START_COMMAND
+    def test_windows_pg_options_no_single_quotes(self) -> None:
+        """Test that the Windows -o payload uses bare stderr.
 
-        assert "unix_socket_directories='{unixsocketdir}'" in template
+        cmd.exe treats single quotes as literal characters.
+        """
+        pg_options = PostgreSQLExecutor._windows_pg_options(5432, "")
+        assert "log_destination=stderr" in pg_options
+        assert "'" not in pg_options
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_unix_template_protects_paths_with_spaces(self) -> None:
         """Test that Unix template properly quotes paths containing spaces.
 
@@ -68,81 +165,38 @@ class TestCommandTemplates:
         the single quotes in the Unix template protect the path from being
         split by PostgreSQL's argument parser.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/my socket dir",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "unixsocketdir": "/tmp/my socket dir"})
 
         command = executor.command
         # The path with spaces should be enclosed in single quotes
         assert "unix_socket_directories='/tmp/my socket dir'" in command
 
-    def test_windows_template_selected_on_windows(self) -> None:
+    @pytest.mark.parametrize("platform_executor", ["Windows"], indirect=True)
+    def test_windows_template_selected_on_windows(self, platform_executor: PostgreSQLExecutor) -> None:
         """Test that Windows template is selected when platform is Windows."""
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="C:/temp/data",
-                unixsocketdir="C:/temp/socket",
-                logfile="C:/temp/log",
-                startparams="-w",
-                dbname="test",
-            )
-
-        command = executor.command
+        command = platform_executor.command
         # Windows template should not have unix_socket_directories
         assert "unix_socket_directories" not in command
         # Windows template should not have single quotes
         assert "log_destination=stderr" in command
         assert "log_destination='stderr'" not in command
 
-    def test_unix_template_selected_on_linux(self) -> None:
+    @pytest.mark.parametrize("platform_executor", ["Linux"], indirect=True)
+    def test_unix_template_selected_on_linux(self, platform_executor: PostgreSQLExecutor) -> None:
         """Test that Unix template is selected when platform is Linux."""
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
-
-        command = executor.command
+        command = platform_executor.command
         # Unix template should have unix_socket_directories with single quotes
         assert "unix_socket_directories='/tmp/socket'" in command
         assert "log_destination='stderr'" in command
 
-    def test_darwin_template_selection(self) -> None:
+    @pytest.mark.parametrize("platform_executor", ["Darwin"], indirect=True)
+    def test_darwin_template_selection(self, platform_executor: PostgreSQLExecutor) -> None:
         """Test that Darwin/macOS uses Unix template.
 
         macOS should use the same Unix template as Linux since it's a Unix-like
         system and supports unix_socket_directories.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Darwin"):
-            executor = PostgreSQLExecutor(
-                executable="/opt/homebrew/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
-
-        command = executor.command
+        command = platform_executor.command
         # Darwin should use Unix template with unix_socket_directories and single quotes
         assert "unix_socket_directories='/tmp/socket'" in command
         assert "log_destination='stderr'" in command
@@ -155,68 +209,44 @@ class TestCommandTemplates:
         """
         # Patch the _LOCALE variable to simulate Darwin environment
         with patch("pytest_postgresql.executor._LOCALE", "en_US.UTF-8"):
-            executor = PostgreSQLExecutor(
-                executable="/opt/homebrew/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
+            executor = PostgreSQLExecutor(**PLATFORM_EXECUTOR_KWARGS["Darwin"])
 
         # Darwin should set en_US.UTF-8 locale
         assert executor.envvars["LC_ALL"] == "en_US.UTF-8"
         assert executor.envvars["LC_CTYPE"] == "en_US.UTF-8"
         assert executor.envvars["LANG"] == "en_US.UTF-8"
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_postgres_options_with_single_quotes_unix(self) -> None:
         """Test postgres_options containing single quotes on Unix.
 
         Single quotes in postgres_options should be preserved and passed through
         to PostgreSQL on Unix systems.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-                postgres_options="-c shared_buffers='128MB' -c work_mem='64MB'",
-            )
+        executor = PostgreSQLExecutor(
+            **{**UNIX_EXECUTOR_KWARGS, "postgres_options": "-c shared_buffers='128MB' -c work_mem='64MB'"}
+        )
 
         command = executor.command
         # postgres_options should be included as-is with single quotes preserved
         assert "-c shared_buffers='128MB' -c work_mem='64MB'" in command
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_postgres_options_with_single_quotes_windows(self) -> None:
         """Test postgres_options containing single quotes on Windows.
 
         Single quotes in postgres_options should work on Windows since they're
         inside the -o parameter's double quotes.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="C:/temp/data",
-                unixsocketdir="C:/temp/socket",
-                logfile="C:/temp/log",
-                startparams="-w",
-                dbname="test",
-                postgres_options="-c shared_buffers='128MB' -c work_mem='64MB'",
-            )
+        executor = PostgreSQLExecutor(
+            **{**WINDOWS_EXECUTOR_KWARGS, "postgres_options": "-c shared_buffers='128MB' -c work_mem='64MB'"}
+        )
 
         command = executor.command
         # postgres_options should be included with single quotes preserved
         assert "-c shared_buffers='128MB' -c work_mem='64MB'" in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_postgres_options_with_single_quoted_search_path(self) -> None:
         """Test postgres_options with a single-quoted search_path value.
 
@@ -226,18 +256,7 @@ class TestCommandTemplates:
         invalid shell command. Single-quoted values are the correct form and must
         be preserved verbatim inside the -o argument.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-                postgres_options="-c search_path='public,other'",
-            )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "postgres_options": "-c search_path='public,other'"})
 
         command = executor.command
         # The single-quoted search_path value must appear verbatim inside the -o argument
@@ -248,47 +267,29 @@ class TestCommandTemplates:
         o_argument = command[o_start : o_end + 1]
         assert "-c search_path='public,other'" in o_argument
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_postgres_options_with_paths_containing_spaces(self) -> None:
         """Test postgres_options with file paths containing spaces.
 
         Config options that reference file paths with spaces should be properly
         quoted within postgres_options.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-                postgres_options="""-c config_file='/etc/postgres/my config.conf'""",
-            )
+        executor = PostgreSQLExecutor(
+            **{**UNIX_EXECUTOR_KWARGS, "postgres_options": """-c config_file='/etc/postgres/my config.conf'"""}
+        )
 
         command = executor.command
         # postgres_options with paths containing spaces should be preserved
         assert """-c config_file='/etc/postgres/my config.conf'""" in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_empty_postgres_options(self) -> None:
         """Test command generation with empty postgres_options.
 
         When postgres_options is empty (default), the command should still be
         properly formatted without extra spaces or malformed syntax.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-                postgres_options="",
-            )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "postgres_options": ""})
 
         command = executor.command
         # Command should still be valid with empty postgres_options
@@ -302,23 +303,14 @@ class TestCommandTemplates:
         )
         assert expected_opts in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_empty_startparams(self) -> None:
         """Test command generation with empty startparams.
 
         When startparams is empty (default), the command should still be
         properly formatted at the end.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "startparams": ""})
 
         command = executor.command
         # Command should be valid with empty startparams
@@ -327,24 +319,14 @@ class TestCommandTemplates:
         # Command should not have trailing spaces at the end
         assert not command.endswith("  ")
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_both_empty_postgres_options_and_startparams(self) -> None:
         """Test command generation with both postgres_options and startparams empty.
 
         When both optional parameters are empty, the command should still
         be properly formatted.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="C:/temp/data",
-                unixsocketdir="C:/temp/socket",
-                logfile="C:/temp/log",
-                startparams="",
-                dbname="test",
-                postgres_options="",
-            )
+        executor = PostgreSQLExecutor(**{**WINDOWS_EXECUTOR_KWARGS, "startparams": "", "postgres_options": ""})
 
         command = executor.command
         # Command should be valid with both empty
@@ -354,6 +336,7 @@ class TestCommandTemplates:
         # Windows template should not have unix_socket_directories
         assert "unix_socket_directories" not in command
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_unixsocketdir_ignored_on_windows_in_command(self) -> None:
         """Test that unixsocketdir value doesn't appear in Windows command.
 
@@ -361,89 +344,57 @@ class TestCommandTemplates:
         should not appear anywhere in the generated command since Windows doesn't
         use unix_socket_directories.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="C:/temp/data",
-                unixsocketdir="C:/this/should/not/appear",
-                logfile="C:/temp/log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(**{**WINDOWS_EXECUTOR_KWARGS, "unixsocketdir": "C:/this/should/not/appear"})
 
         command = executor.command
         # The unixsocketdir value should NOT appear in the Windows command
         assert "C:/this/should/not/appear" not in command
         assert "unix_socket_directories" not in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_paths_with_multiple_consecutive_spaces(self) -> None:
         """Test paths with multiple consecutive spaces.
 
         Paths with multiple spaces should be properly quoted and preserved.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/my    socket    dir",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "unixsocketdir": "/tmp/my    socket    dir"})
 
         command = executor.command
         # Multiple spaces should be preserved
         assert "unix_socket_directories='/tmp/my    socket    dir'" in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_paths_with_special_shell_characters(self) -> None:
         """Test paths with special shell characters.
 
         Paths with shell metacharacters should be properly quoted to prevent
         shell interpretation. Testing with ampersand, semicolon, and pipe.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket&test",
-                logfile="/tmp/log;file",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(
+            **{**UNIX_EXECUTOR_KWARGS, "unixsocketdir": "/tmp/socket&test", "logfile": "/tmp/log;file"}
+        )
 
         command = executor.command
         # Special characters should be inside quotes
         assert "unix_socket_directories='/tmp/socket&test'" in command
         assert '-l "/tmp/log;file"' in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_paths_with_unicode_characters(self) -> None:
         """Test paths with Unicode characters.
 
         Unicode characters in paths should be properly handled and preserved.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/sóckét_dïr_日本語",
-                logfile="/tmp/lög_文件.log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(
+            **{**UNIX_EXECUTOR_KWARGS, "unixsocketdir": "/tmp/sóckét_dïr_日本語", "logfile": "/tmp/lög_文件.log"}
+        )
 
         command = executor.command
         # Unicode characters should be preserved
         assert "unix_socket_directories='/tmp/sóckét_dïr_日本語'" in command
         assert '-l "/tmp/lög_文件.log"' in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_unixsocketdir_with_apostrophe_is_escaped(self) -> None:
         """Regression test: apostrophes in unixsocketdir are escaped for the GUC parser.
 
@@ -453,17 +404,7 @@ class TestCommandTemplates:
         prematurely close the GUC string, making PostgreSQL reject the option or
         silently misparse it.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/o'hare",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "unixsocketdir": "/tmp/o'hare"})
 
         command = executor.command
         # Apostrophe must be doubled so the GUC parser sees a valid string
@@ -471,41 +412,32 @@ class TestCommandTemplates:
         # Raw un-escaped form must NOT appear
         assert "unix_socket_directories='/tmp/o'hare'" not in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_unixsocketdir_with_multiple_apostrophes_are_escaped(self) -> None:
         """Regression test: multiple apostrophes in unixsocketdir are all escaped."""
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/it's o'hare",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "unixsocketdir": "/tmp/it's o'hare"})
 
         command = executor.command
         assert "unix_socket_directories='/tmp/it''s o''hare'" in command
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_command_with_all_special_characters_combined(self) -> None:
         """Test command with multiple types of special characters.
 
         This comprehensive test combines spaces, quotes, special shell chars,
         and Unicode to ensure the command handles complex real-world scenarios.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/16/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/my data & files",
-                unixsocketdir="/tmp/sóckét dir (test)",
-                logfile="/tmp/log file; output.log",
-                startparams="-w -t 30",
-                dbname="test",
-                postgres_options="-c shared_buffers='256MB' -c config_file='/etc/pg/main.conf'",
-            )
+        executor = PostgreSQLExecutor(
+            executable="/usr/lib/postgresql/16/bin/pg_ctl",
+            host="localhost",
+            port=5432,
+            datadir="/tmp/my data & files",
+            unixsocketdir="/tmp/sóckét dir (test)",
+            logfile="/tmp/log file; output.log",
+            startparams="-w -t 30",
+            dbname="test",
+            postgres_options="-c shared_buffers='256MB' -c config_file='/etc/pg/main.conf'",
+        )
 
         command = executor.command
         # All special characters should be properly handled
@@ -520,23 +452,8 @@ class TestCommandTemplates:
 class TestWindowsCompatibility:
     """Test Windows-specific process management functionality."""
 
-    def test_windows_terminate_process(self) -> None:
+    def test_windows_terminate_process(self, executor: PostgreSQLExecutor, mock_process: MagicMock) -> None:
         """Test Windows process termination."""
-        executor = PostgreSQLExecutor(
-            executable="/path/to/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
-
-        # Mock process
-        mock_process = MagicMock()
-        executor.process = mock_process
-
         # No need to mock platform.system() since the method doesn't check it anymore
         executor._windows_terminate_process()
 
@@ -544,23 +461,10 @@ class TestWindowsCompatibility:
         mock_process.terminate.assert_called_once()
         mock_process.wait.assert_called()
 
-    def test_windows_terminate_process_force_kill(self) -> None:
+    def test_windows_terminate_process_force_kill(self, executor: PostgreSQLExecutor, mock_process: MagicMock) -> None:
         """Test Windows process termination with force kill on timeout."""
-        executor = PostgreSQLExecutor(
-            executable="/path/to/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
-
-        # Mock process that times out
-        mock_process = MagicMock()
+        # Process that times out
         mock_process.wait.side_effect = [subprocess.TimeoutExpired(cmd="test", timeout=5), None]
-        executor.process = mock_process
 
         # No need to mock platform.system() since the method doesn't check it anymore
         executor._windows_terminate_process()
@@ -570,220 +474,147 @@ class TestWindowsCompatibility:
         mock_process.kill.assert_called_once()
         assert mock_process.wait.call_count == 2
 
-    def test_stop_method_windows(self) -> None:
+    @pytest.mark.usefixtures("fake_windows")
+    def test_stop_method_windows(
+        self, executor: PostgreSQLExecutor, check_output_calls: list[CallRecord], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test stop method on Windows."""
-        executor = PostgreSQLExecutor(
-            executable="/path/to/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
-
-        # Mock subprocess and process
-        with (
-            patch("pytest_postgresql.executor.subprocess.check_output") as mock_subprocess,
-            patch("pytest_postgresql.executor.platform.system", return_value="Windows"),
-            patch.object(executor, "_windows_terminate_process") as mock_terminate,
-        ):
-            result = executor.stop()
-
-            # Should call pg_ctl stop and Windows terminate
-            mock_subprocess.assert_called_once_with(
-                ["/path/to/pg_ctl", "stop", "-D", "/tmp/data", "-m", "f"],
-                timeout=executor._timeout,
-            )
-            mock_terminate.assert_called_once_with(None)
-            assert result is executor
+        # Mock process termination
+        mock_terminate = MagicMock()
+        monkeypatch.setattr(executor, "_windows_terminate_process", mock_terminate)
+        result = executor.stop()
+
+        # Should call pg_ctl stop and Windows terminate
+        assert check_output_calls == [
+            ((["/path/to/pg_ctl", "stop", "-D", "/tmp/data", "-m", "f"],), {"timeout": executor._timeout})
+        ]
+        mock_terminate.assert_called_once_with(None)
+        assert result is executor
 
-    def test_stop_method_unix(self) -> None:
+    @pytest.mark.usefixtures("fake_linux")
+    def test_stop_method_unix(self, executor: PostgreSQLExecutor, check_output_calls: list[CallRecord]) -> None:
         """Test stop method on Unix systems."""
-        executor = PostgreSQLExecutor(
-            executable="/path/to/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
-
-        # Mock subprocess and super().stop
-        with (
-            patch("pytest_postgresql.executor.subprocess.check_output") as mock_subprocess,
-            patch("pytest_postgresql.executor.platform.system", return_value="Linux"),
-            patch("pytest_postgresql.executor.TCPExecutor.stop") as mock_super_stop,
-        ):
+        # Mock super().stop
+        with patch("pytest_postgresql.executor.TCPExecutor.stop") as mock_super_stop:
             mock_super_stop.return_value = executor
             result = executor.stop()
 
             # Should call pg_ctl stop with the list-style argv and expected timeout
-            mock_subprocess.assert_called_once_with(
-                ["/path/to/pg_ctl", "stop", "-D", "/tmp/data", "-m", "f"],
-                timeout=executor._timeout,
-            )
+            assert check_output_calls == [
+                ((["/path/to/pg_ctl", "stop", "-D", "/tmp/data", "-m", "f"],), {"timeout": executor._timeout})
+            ]
             mock_super_stop.assert_called_once_with(None, None)
             assert result is executor
 
-    def test_stop_method_fallback_on_killpg_error(self) -> None:
+    @pytest.mark.usefixtures("fake_linux", "no_killpg")
+    def test_stop_method_fallback_on_killpg_error(
+        self, executor: PostgreSQLExecutor, check_output_calls: list[CallRecord], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test stop method falls back to Windows termination on killpg AttributeError."""
-        executor = PostgreSQLExecutor(
-            executable="/path/to/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
-
-        # Mock subprocess and super().stop to raise AttributeError
-        with (
-            patch("pytest_postgresql.executor.subprocess.check_output") as mock_subprocess,
-            patch("pytest_postgresql.executor.platform.system", return_value="Linux"),
-            patch(
-                "pytest_postgresql.executor.TCPExecutor.stop",
-                side_effect=AttributeError("module 'os' has no attribute 'killpg'"),
-            ),
-            patch.object(executor, "_windows_terminate_process") as mock_terminate,
+        # Mock super().stop to raise AttributeError
+        mock_terminate = MagicMock()
+        monkeypatch.setattr(executor, "_windows_terminate_process", mock_terminate)
+        with patch(
+            "pytest_postgresql.executor.TCPExecutor.stop",
+            side_effect=AttributeError("module 'os' has no attribute 'killpg'"),
         ):
-            # Temporarily remove os.killpg so hasattr(os, "killpg") returns False
-            real_killpg = getattr(os, "killpg", None)
-            try:
-                if real_killpg is not None:
-                    delattr(os, "killpg")
-                result = executor.stop()
-            finally:
-                if real_killpg is not None:
-                    os.killpg = real_killpg
+            result = executor.stop()
 
             # Should call pg_ctl stop, fail on super().stop, then use Windows terminate
-            mock_subprocess.assert_called_once()
+            assert len(check_output_calls) == 1
             mock_terminate.assert_called_once()
             assert result is executor
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_command_formatting_windows(self) -> None:
         """Test that command is properly formatted for Windows paths."""
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5555,
-                datadir="C:/temp/data",
-                unixsocketdir="C:/temp/socket",
-                logfile="C:/temp/log.txt",
-                startparams="-w -s",
-                dbname="testdb",
-                postgres_options="-c shared_preload_libraries=test",
-            )
+        executor = PostgreSQLExecutor(
+            executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
+            host="localhost",
+            port=5555,
+            datadir="C:/temp/data",
+            unixsocketdir="C:/temp/socket",
+            logfile="C:/temp/log.txt",
+            startparams="-w -s",
+            dbname="testdb",
+            postgres_options="-c shared_preload_libraries=test",
+        )
 
         # The command should be properly formatted without single quotes
         # and without unix_socket_directories (irrelevant on Windows)
-        expected_parts = [
-            '"C:/Program Files/PostgreSQL/bin/pg_ctl.exe" start',
-            '-D "C:/temp/data"',
-            '-o "-F -p 5555 -c log_destination=stderr',
-            "-c logging_collector=off",
-            '-c shared_preload_libraries=test"',
-            '-l "C:/temp/log.txt"',
-            "-w -s",
-        ]
-
         command = executor.command
-        for part in expected_parts:
-            assert part in command, f"Expected '{part}' in command: {command}"
+        assert WINDOWS_COMMAND_RE.search(command), f"Expected {WINDOWS_COMMAND_RE.pattern!r} in command: {command}"
 
         # Verify unix_socket_directories is NOT in the Windows command
         assert "unix_socket_directories" not in command, (
             f"unix_socket_directories should not be in Windows command: {command}"
         )
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_windows_datadir_with_spaces(self) -> None:
         """Test Windows datadir with spaces in path.
 
         Windows paths with spaces should be properly quoted with double quotes.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="C:/Program Files/PostgreSQL/my data dir",
-                unixsocketdir="C:/temp/socket",
-                logfile="C:/temp/log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(
+            **{**WINDOWS_EXECUTOR_KWARGS, "datadir": "C:/Program Files/PostgreSQL/my data dir"}
+        )
 
         command = executor.command
         # datadir with spaces should be quoted
         assert '-D "C:/Program Files/PostgreSQL/my data dir"' in command
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_windows_logfile_with_spaces(self) -> None:
         """Test Windows logfile with spaces in path.
 
         Windows log file paths with spaces should be properly quoted with double quotes.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="C:/temp/data",
-                unixsocketdir="C:/temp/socket",
-                logfile="C:/Program Files/PostgreSQL/logs/my log file.log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(
+            **{**WINDOWS_EXECUTOR_KWARGS, "logfile": "C:/Program Files/PostgreSQL/logs/my log file.log"}
+        )
 
         command = executor.command
         # logfile with spaces should be quoted
         assert '-l "C:/Program Files/PostgreSQL/logs/my log file.log"' in command
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_windows_unc_paths(self) -> None:
         r"""Test Windows UNC (Universal Naming Convention) paths.
 
         UNC paths like \\server\share should be properly handled on Windows.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:/Program Files/PostgreSQL/bin/pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="//server/share/postgres/data",
-                unixsocketdir="//server/share/postgres/socket",
-                logfile="//server/share/postgres/logs/postgresql.log",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(
+            **{
+                **WINDOWS_EXECUTOR_KWARGS,
+                "datadir": "//server/share/postgres/data",
+                "unixsocketdir": "//server/share/postgres/socket",
+                "logfile": "//server/share/postgres/logs/postgresql.log",
+            }
+        )
 
         command = executor.command
         # UNC paths should be properly quoted (using forward slashes in Python)
         assert '-D "//server/share/postgres/data"' in command
         assert '-l "//server/share/postgres/logs/postgresql.log"' in command
 
+    @pytest.mark.usefixtures("fake_windows")
     def test_windows_mixed_slashes(self) -> None:
         """Test Windows paths with mixed forward and backslashes.
 
         Windows accepts both forward slashes and backslashes, and the command
         should handle both properly.
         """
-        with patch("pytest_postgresql.executor.platform.system", return_value="Windows"):
-            executor = PostgreSQLExecutor(
-                executable="C:\\Program Files\\PostgreSQL\\bin\\pg_ctl.exe",
-                host="localhost",
-                port=5432,
-                datadir="C:\\temp\\data",
-                unixsocketdir="C:\\temp\\socket",
-                logfile="C:\\temp\\log.txt",
-                startparams="-w",
-                dbname="test",
-            )
+        executor = PostgreSQLExecutor(
+            executable="C:\\Program Files\\PostgreSQL\\bin\\pg_ctl.exe",
+            host="localhost",
+            port=5432,
+            datadir="C:\\temp\\data",
+            unixsocketdir="C:\\temp\\socket",
+            logfile="C:\\temp\\log.txt",
+            startparams="-w",
+            dbname="test",
+        )
 
         command = executor.command
         # Paths with backslashes should be properly quoted
@@ -803,14 +634,7 @@ class TestRunningMethod:
         OS without any shell parsing, so no quoting is required or desired.
         """
         executor = PostgreSQLExecutor(
-            executable="C:/Program Files/PostgreSQL/17/bin/pg_ctl.exe",
-            host="localhost",
-            port=5432,
-            datadir="C:/temp/data",
-            unixsocketdir="C:/temp/socket",
-            logfile="C:/temp/log",
-            startparams="-w",
-            dbname="test",
+            **{**WINDOWS_EXECUTOR_KWARGS, "executable": "C:/Program Files/PostgreSQL/17/bin/pg_ctl.exe"}
         )
 
         with (
@@ -832,16 +656,7 @@ class TestRunningMethod:
         Passing shell=True with a list is both redundant and risky; the list
         form with shell=False (the default) is the correct approach.
         """
-        executor = PostgreSQLExecutor(
-            executable="/usr/lib/postgresql/17/bin/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
+        executor = PostgreSQLExecutor(**UNIX_EXECUTOR_KWARGS)
 
         with (
             patch("pytest_postgresql.executor.os.path.exists", return_value=True),
@@ -855,16 +670,7 @@ class TestRunningMethod:
 
     def test_running_returns_true_on_zero_returncode(self) -> None:
         """Test that running() returns True when pg_ctl status exits 0."""
-        executor = PostgreSQLExecutor(
-            executable="/usr/lib/postgresql/17/bin/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
+        executor = PostgreSQLExecutor(**UNIX_EXECUTOR_KWARGS)
 
         with (
             patch("pytest_postgresql.executor.os.path.exists", return_value=True),
@@ -878,16 +684,7 @@ class TestRunningMethod:
 
     def test_running_datadir_with_spaces_passed_as_argv_element(self) -> None:
         """Test that a datadir with spaces is passed verbatim as an argv element."""
-        executor = PostgreSQLExecutor(
-            executable="/usr/lib/postgresql/17/bin/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/my data dir",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-        )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "datadir": "/tmp/my data dir"})
 
         with (
             patch("pytest_postgresql.executor.os.path.exists", return_value=True),
@@ -901,17 +698,7 @@ class TestRunningMethod:
 
     def test_running_uses_timeout(self) -> None:
         """Test that running() passes self._timeout to subprocess.run."""
-        executor = PostgreSQLExecutor(
-            executable="/usr/lib/postgresql/17/bin/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-            timeout=42,
-        )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "timeout": 42})
 
         with (
             patch("pytest_postgresql.executor.os.path.exists", return_value=True),
@@ -925,17 +712,7 @@ class TestRunningMethod:
 
     def test_running_returns_true_on_timeout(self) -> None:
         """Test that running() treats pg_ctl status timeout as still running."""
-        executor = PostgreSQLExecutor(
-            executable="/usr/lib/postgresql/17/bin/pg_ctl",
-            host="localhost",
-            port=5432,
-            datadir="/tmp/data",
-            unixsocketdir="/tmp/socket",
-            logfile="/tmp/log",
-            startparams="-w",
-            dbname="test",
-            timeout=30,
-        )
+        executor = PostgreSQLExecutor(**{**UNIX_EXECUTOR_KWARGS, "timeout": 30})
 
         with (
             patch("pytest_postgresql.executor.os.path.exists", return_value=True),
@@ -950,6 +727,7 @@ class TestRunningMethod:
 class TestInitdbEnvironment:
     """Test initdb subprocess environment construction."""
 
+    @pytest.mark.usefixtures("fake_linux")
     def test_initdb_env_includes_locale_overrides(
         self,
         monkeypatch: pytest.MonkeyPatch,
@@ -957,19 +735,9 @@ class TestInitdbEnvironment:
         """Initdb uses the executor locale environment."""
         monkeypatch.setenv("HOME", "/home/user")
         monkeypatch.setenv("PGDATA", "/wrong")
-        with patch("pytest_postgresql.executor.platform.system", return_value="Linux"):
-            executor = PostgreSQLExecutor(
-                executable="/usr/lib/postgresql/17/bin/pg_ctl",
-                host="localhost",
-                port=5432,
-                datadir="/tmp/data",
-                unixsocketdir="/tmp/socket",
-                logfile="/tmp/log",
-                startparams="-w",
-                dbname="test",
-            )
-
-            env = executor._initdb_env()
+        executor = PostgreSQLExecutor(**UNIX_EXECUTOR_KWARGS)
+
+        env = executor._initdb_env()
 
         assert env["HOME"] == "/home/user"
         assert "PGDATA" not in env
@@ -977,15 +745,9 @@ class TestInitdbEnvironment:
         assert env["LC_CTYPE"] == executor.envvars["LC_CTYPE"]
         assert env["LANG"] == executor.envvars["LANG"]
 
-    def test_build_initdb_command_uses_pg_ctl_on_windows(
-        self,
-        monkeypatch: pytest.MonkeyPatch,
-    ) -> None:
+    @pytest.mark.usefixtures("fake_windows")
+    def test_build_initdb_command_uses_pg_ctl_on_windows(self) -> None:
         """Windows must invoke initdb through pg_ctl with wrapped options."""
-        monkeypatch.setattr(
-            "pytest_postgresql.executor.platform.system",
-            lambda: "Windows",
-        )
         executor = PostgreSQLExecutor(
             executable="C:/Program Files/PostgreSQL/17/bin/pg_ctl.exe",
             host="localhost",